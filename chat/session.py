@@ -3,7 +3,7 @@
 import os
 from datetime import datetime
 
-import psycopg2
+from database.connection import get_connection, release_connection
 
 
 class ChatSession:
@@ -26,8 +26,9 @@ class ChatSession:
         if self._data:
             return self._data
 
-        with psycopg2.connect(self.db_url) as conn:
-            with conn.cursor() as cur:
+        conn = get_connection(self.db_url)
+        try:
+            with conn, conn.cursor() as cur:
                 # Try to get existing session
                 cur.execute(
                     "SELECT * FROM chat_sessions WHERE phone_number = %s", (self.phone_number,)
@@ -53,6 +54,8 @@ class ChatSession:
                     self._data = dict(zip(cols, row, strict=False))
                     self._is_new_session = True
                     conn.commit()
+        finally:
+            release_connection(self.db_url, conn)
 
         return self._data
 
@@ -114,8 +117,9 @@ class ChatSession:
 
         params.append(self.phone_number)
 
-        with psycopg2.connect(self.db_url) as conn:
-            with conn.cursor() as cur:
+        conn = get_connection(self.db_url)
+        try:
+            with conn, conn.cursor() as cur:
                 query = f"""
                     UPDATE chat_sessions
                     SET {', '.join(updates)}
@@ -128,6 +132,8 @@ class ChatSession:
                     cols = [desc[0] for desc in cur.description]
                     self._data = dict(zip(cols, row, strict=False))
                 conn.commit()
+        finally:
+            release_connection(self.db_url, conn)
 
     def reset(self):
         """Reset session to idle state."""
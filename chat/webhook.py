@@ -1,16 +1,15 @@
 """Twilio SMS/MMS webhook handler for Modal."""
 
 import os
-from urllib.parse import parse_qs
+from urllib.parse import parse_qsl
 
 import requests
 
 
 def parse_twilio_request(body: bytes) -> dict:
     """Parse incoming Twilio webhook request body."""
-    parsed = parse_qs(body.decode("utf-8"))
-    # parse_qs returns lists, extract single values
-    return {k: v[0] if len(v) == 1 else v for k, v in parsed.items()}
+    # Twilio sends each field once, so pairs map straight to a dict
+    return dict(parse_qsl(body.decode("utf-8")))
 
 
 def download_media(media_url: str, auth: tuple) -> bytes | None:
@@ -163,7 +162,7 @@ def handle_incoming_sms(
                     if metadata.get("image_hash_sha256"):
                         conn = db._get_connection()
                         duplicate = check_exact_duplicate(conn, metadata["image_hash_sha256"])
-                        conn.close()
+                        db._release(conn)
 
                         if duplicate:
                             print(f"⚠️ Duplicate image detected (sighting #{duplicate['id']})")
@@ -0,0 +1,110 @@
+"""Process-wide PostgreSQL connection reuse."""
+
+import atexit
+import threading
+import time
+
+import psycopg2
+from psycopg2 import extensions
+
+# Idle connections kept open per database URL
+MAX_IDLE_CONNECTIONS = 2
+
+# Connections idle longer than this (seconds) are pinged before reuse, since Neon
+# closes connections when its compute suspends after a few minutes of inactivity
+STALE_AFTER = 60
+
+# TCP keepalives so a connection held in a warm container notices a dropped peer
+# instead of hanging on its next query
+KEEPALIVE_OPTIONS = {"keepalives": 1, "keepalives_idle": 30, "keepalives_interval": 10}
+
+# db_url -> [(connection, released_at)], most recently released last. Checked-out
+# connections aren't tracked, so one that's never released is simply garbage collected.
+_idle: dict[str, list[tuple[object, float]]] = {}
+_lock = threading.Lock()
+
+
+def _is_alive(conn) -> bool:
+    """Check that a connection still reaches the server."""
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT 1")
+        conn.rollback()
+        return True
+    except (psycopg2.OperationalError, psycopg2.InterfaceError):
+        return False
+
+
+def get_connection(db_url: str):
+    """
+    Get a connection to db_url, reusing an idle one when possible.
+
+    Saves the TCP/TLS/auth handshake on every call after the first. Hand the
+    connection back with release_connection() rather than closing it.
+
+    Args:
+        db_url: PostgreSQL connection URL
+
+    Returns:
+        psycopg2 connection
+    """
+    while True:
+        with _lock:
+            idle = _idle.get(db_url)
+            if not idle:
+                break
+            conn, released_at = idle.pop()
+
+        if conn.closed:
+            continue
+        if time.monotonic() - released_at < STALE_AFTER or _is_alive(conn):
+            return conn
+        # Dropped by the server while idle
+        conn.close()
+
+    return psycopg2.connect(db_url, **KEEPALIVE_OPTIONS)
+
+
+def release_connection(db_url: str, conn):
+    """
+    Hand a connection from get_connection() back for reuse.
+
+    Any open transaction is rolled back. Broken connections, and any beyond
+    MAX_IDLE_CONNECTIONS, are closed instead of kept.
+
+    Args:
+        db_url: PostgreSQL connection URL the connection was opened for
+        conn: The connection
+    """
+    if conn.closed:
+        return
+
+    status = conn.info.transaction_status
+    if status == extensions.TRANSACTION_STATUS_UNKNOWN:
+        conn.close()
+        return
+
+    try:
+        if status != extensions.TRANSACTION_STATUS_IDLE:
+            conn.rollback()
+    except psycopg2.Error:
+        conn.close()
+        return
+
+    with _lock:
+        idle = _idle.setdefault(db_url, [])
+        if len(idle) < MAX_IDLE_CONNECTIONS:
+            idle.append((conn, time.monotonic()))
+            return
+
+    conn.close()
+
+
+@atexit.register
+def close_all():
+    """Close every idle connection."""
+    with _lock:
+        for idle in _idle.values():
+            for conn, _ in idle:
+                conn.close()
+        _idle.clear()
@@ -0,0 +1,8 @@
+-- Index-backed wildcard plate search (see validate.tlc.plate_pattern_condition).
+-- text_pattern_ops lets LIKE 'T73_____' use a range scan regardless of collation;
+-- the reverse() index does the same for patterns anchored at the end ('___580C').
+CREATE INDEX IF NOT EXISTS idx_tlc_vehicles_plate_pattern
+    ON tlc_vehicles (dmv_license_plate_number text_pattern_ops);
+
+CREATE INDEX IF NOT EXISTS idx_tlc_vehicles_plate_reverse_pattern
+    ON tlc_vehicles (reverse(dmv_license_plate_number) text_pattern_ops);
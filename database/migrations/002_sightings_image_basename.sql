@@ -0,0 +1,8 @@
+-- File name of each sighting image, so batch-process can check which local
+-- images are already in the database with an index lookup instead of a scan.
+ALTER TABLE sightings
+    ADD COLUMN IF NOT EXISTS image_basename TEXT
+    GENERATED ALWAYS AS (regexp_replace(image_path, '^.*/', '')) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_sightings_image_basename
+    ON sightings (image_basename);
@@ -0,0 +1,44 @@
+-- Running row count of tlc_vehicles, kept current by statement-level triggers,
+-- so get_tlc_vehicle_count() reads one row instead of counting the table.
+CREATE TABLE IF NOT EXISTS tlc_meta (
+    key TEXT PRIMARY KEY,
+    value BIGINT NOT NULL
+);
+
+INSERT INTO tlc_meta (key, value)
+SELECT 'count', COUNT(*) FROM tlc_vehicles
+ON CONFLICT (key) DO NOTHING;
+
+CREATE OR REPLACE FUNCTION tlc_meta_update_count() RETURNS trigger AS $$
+DECLARE
+    delta BIGINT;
+BEGIN
+    IF TG_OP = 'TRUNCATE' THEN
+        UPDATE tlc_meta SET value = 0 WHERE key = 'count';
+        RETURN NULL;
+    END IF;
+
+    -- For INSERT ... ON CONFLICT DO UPDATE this only holds the rows actually inserted
+    SELECT COUNT(*) INTO delta FROM changed_rows;
+    IF TG_OP = 'DELETE' THEN
+        delta := -delta;
+    END IF;
+
+    UPDATE tlc_meta SET value = value + delta WHERE key = 'count';
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE TRIGGER tlc_vehicles_count_insert
+    AFTER INSERT ON tlc_vehicles
+    REFERENCING NEW TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION tlc_meta_update_count();
+
+CREATE OR REPLACE TRIGGER tlc_vehicles_count_delete
+    AFTER DELETE ON tlc_vehicles
+    REFERENCING OLD TABLE AS changed_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION tlc_meta_update_count();
+
+CREATE OR REPLACE TRIGGER tlc_vehicles_count_truncate
+    AFTER TRUNCATE ON tlc_vehicles
+    FOR EACH STATEMENT EXECUTE FUNCTION tlc_meta_update_count();
@@ -0,0 +1,7 @@
+-- Wildcard plate patterns with no fixed start or end ('**58**C*') can't use the
+-- range-scan indexes from 001. A trigram index still narrows them to plates
+-- containing the pattern's fixed runs of three or more characters.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_tlc_vehicles_plate_trgm
+    ON tlc_vehicles USING gin (dmv_license_plate_number gin_trgm_ops);
@@ -0,0 +1,14 @@
+-- Posting queries split sightings on post_uri. Partial indexes keep each side small:
+-- the unposted queue (get_unposted_sightings, get_unposted_count) is read in
+-- timestamp order, and the posted per-plate counts can be answered from the index.
+CREATE INDEX IF NOT EXISTS idx_sightings_unposted
+    ON sightings (timestamp) WHERE post_uri IS NULL;
+
+CREATE INDEX IF NOT EXISTS idx_sightings_posted_plate
+    ON sightings (license_plate) WHERE post_uri IS NOT NULL;
+
+-- Per-plate sighting counts (get_sighting_count)
+CREATE INDEX IF NOT EXISTS idx_sightings_plate
+    ON sightings (license_plate);
+
+ANALYZE sightings;
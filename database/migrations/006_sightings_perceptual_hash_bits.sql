@@ -0,0 +1,10 @@
+-- Perceptual hashes as bit(64), so find_similar_images can XOR and popcount them
+-- in the query (bit_count, PostgreSQL 14+) and only fetch the near matches.
+-- Anything that isn't a 16-digit hex dHash is left NULL.
+ALTER TABLE sightings
+    ADD COLUMN IF NOT EXISTS image_hash_perceptual_bits BIT(64)
+    GENERATED ALWAYS AS (
+        CASE WHEN image_hash_perceptual ~ '^[0-9a-fA-F]{16}$'
+            THEN ('x' || image_hash_perceptual)::BIT(64)
+        END
+    ) STORED;
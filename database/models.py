@@ -1,11 +1,58 @@
 """Core database operations for sightings."""
 
+import functools
 import os
+import time
 from datetime import datetime
+from pathlib import Path
 
 import psycopg2
 import psycopg2.extras
 
+from .connection import get_connection, release_connection
+
+# Idempotent SQL files applied in filename order by apply_migrations()
+MIGRATIONS_DIR = Path(__file__).parent / "migrations"
+
+# Sighting columns plus contributor info. Queries returning sighting named tuples
+# append their WHERE/ORDER BY to this, so every caller sees the same fields.
+SIGHTING_SELECT = """
+    SELECT s.id, s.license_plate, s.timestamp, s.latitude, s.longitude, s.image_path,
+           s.created_at, s.post_uri, s.contributor_id,
+           c.preferred_name, c.bluesky_handle, c.phone_number, s.image_basename
+    FROM sightings s
+    LEFT JOIN contributors c ON s.contributor_id = c.id
+"""
+
+# (db_url, method name) -> (value, expires_at) for methods wrapped in _ttl_cache.
+# Module-level so a warm Modal container keeps counts across SightingsDatabase instances.
+_count_cache: dict[tuple[str, str], tuple[int, float]] = {}
+
+
+def _ttl_cache(seconds: float):
+    """
+    Cache a no-argument SightingsDatabase method's result per database for `seconds`.
+
+    Writes that change the result should drop it with _invalidate_counts().
+    """
+
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self):
+            key = (self.db_url, method.__name__)
+            now = time.monotonic()
+            cached = _count_cache.get(key)
+            if cached and cached[1] > now:
+                return cached[0]
+
+            value = method(self)
+            _count_cache[key] = (value, now + seconds)
+            return value
+
+        return wrapper
+
+    return decorator
+
 
 class SightingsDatabase:
     """Database operations for Fisker Ocean sightings."""
@@ -22,8 +69,40 @@ class SightingsDatabase:
         pass
 
     def _get_connection(self):
-        """Get a database connection."""
-        return psycopg2.connect(self.db_url)
+        """Get a database connection from the process-wide pool."""
+        return get_connection(self.db_url)
+
+    def _release(self, conn):
+        """Return a connection from _get_connection() to the pool."""
+        release_connection(self.db_url, conn)
+
+    def _invalidate_counts(self, *method_names: str):
+        """Drop cached results of the given _ttl_cache methods for this database."""
+        for name in method_names:
+            _count_cache.pop((self.db_url, name), None)
+
+    def apply_migrations(self) -> list[str]:
+        """
+        Apply the SQL files in database/migrations, in filename order.
+
+        Migrations only use IF NOT EXISTS-style statements, so re-running
+        them against an up-to-date database is a no-op.
+
+        Returns:
+            Names of the migration files that were run
+        """
+        migrations = sorted(MIGRATIONS_DIR.glob("*.sql"))
+
+        conn = self._get_connection()
+        try:
+            cursor = conn.cursor()
+            for path in migrations:
+                cursor.execute(path.read_text())
+            conn.commit()
+        finally:
+            self._release(conn)
+
+        return [path.name for path in migrations]
 
     # ==================== Contributor Operations ====================
 
@@ -76,7 +155,7 @@ class SightingsDatabase:
             return contributor_id
 
         finally:
-            conn.close()
+            self._release(conn)
 
     def get_contributor(
         self, phone_number: str = None, bluesky_handle: str = None, contributor_id: int = None
@@ -102,7 +181,7 @@ class SightingsDatabase:
             return cursor.fetchone()
 
         finally:
-            conn.close()
+            self._release(conn)
 
     def update_contributor_name(self, contributor_id: int, preferred_name: str):
         """Update a contributor's preferred name."""
@@ -120,7 +199,7 @@ class SightingsDatabase:
             conn.commit()
 
         finally:
-            conn.close()
+            self._release(conn)
 
     def get_contributor_display_name(self, contributor_id: int) -> str | None:
         """
@@ -156,6 +235,7 @@ class SightingsDatabase:
         contributor_id: int,
         image_hash_sha256: str | None = None,
         image_hash_perceptual: str | None = None,
+        conn=None,
     ):
         """
         Add a new sighting to the database.
@@ -169,6 +249,8 @@ class SightingsDatabase:
             contributor_id: ID of contributor (required)
             image_hash_sha256: SHA-256 hash of image (optional, calculated if not provided)
             image_hash_perceptual: Perceptual hash of image (optional, calculated if not provided)
+            conn: Open connection to reuse across calls (optional). The sighting is
+                still committed before returning, and the connection is left open.
 
         Returns:
             dict with keys:
@@ -187,7 +269,9 @@ class SightingsDatabase:
             find_similar_images,
         )
 
-        conn = self._get_connection()
+        own_conn = conn is None
+        if own_conn:
+            conn = self._get_connection()
         cursor = conn.cursor()
 
         # Calculate hashes if not provided
@@ -207,7 +291,9 @@ class SightingsDatabase:
         if image_hash_sha256:
             exact_duplicate = check_exact_duplicate(conn, image_hash_sha256)
             if exact_duplicate:
-                conn.close()
+                conn.rollback()
+                if own_conn:
+                    self._release(conn)
                 return None  # Reject exact duplicates
 
         # Check for near-duplicates by perceptual hash
@@ -253,20 +339,64 @@ class SightingsDatabase:
             conn.rollback()
             # Image path already exists - this is expected behavior
             return None
+        except psycopg2.Error:
+            # Leave a reused connection usable for the next sighting
+            conn.rollback()
+            raise
         finally:
-            conn.close()
+            if own_conn:
+                self._release(conn)
 
     def get_sighting_by_id(self, sighting_id: int):
-        """Get a sighting by ID."""
+        """
+        Get a sighting by ID.
+
+        Returns a named tuple with contributor info (same shape as get_unposted_sightings):
+        (id, license_plate, timestamp, latitude, longitude, image_path, created_at, post_uri,
+         contributor_id, preferred_name, bluesky_handle, phone_number, image_basename)
+        """
         conn = self._get_connection()
-        cursor = conn.cursor()
+        cursor = conn.cursor(cursor_factory=psycopg2.extras.NamedTupleCursor)
 
-        cursor.execute("SELECT * FROM sightings WHERE id = %s", (sighting_id,))
+        cursor.execute(SIGHTING_SELECT + "WHERE s.id = %s", (sighting_id,))
         sighting = cursor.fetchone()
-        conn.close()
+        self._release(conn)
 
         return sighting
 
+    def list_unprocessed_image_names(self, names: list[str]) -> set[str]:
+        """
+        Find which of the given image file names don't have a sighting yet.
+
+        Anti-joins the candidate names against the indexed image_basename
+        column (database/migrations), so each name is one index probe and only
+        the new names (usually a handful) come back.
+
+        Args:
+            names: Image file names (without directories)
+
+        Returns:
+            Subset of names that aren't in the database
+        """
+        if not names:
+            return set()
+
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute(
+            """
+            SELECT c.name
+            FROM unnest(%s::text[]) AS c(name)
+            WHERE NOT EXISTS (SELECT 1 FROM sightings s WHERE s.image_basename = c.name)
+        """,
+            (list(names),),
+        )
+        unprocessed = {row[0] for row in cursor.fetchall()}
+        self._release(conn)
+
+        return unprocessed
+
     def get_sighting_count(self, license_plate: str) -> int:
         """Get the number of times a license plate has been spotted."""
         conn = self._get_connection()
@@ -280,10 +410,26 @@ class SightingsDatabase:
         )
 
         count = cursor.fetchone()[0]
-        conn.close()
+        self._release(conn)
 
         return count
 
+    def get_sighting_counts_by_plate(self) -> dict[str, int]:
+        """
+        Get the number of sightings (posted or not) for every sighted plate.
+
+        Returns:
+            Dict mapping license plate to sighting count
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute("SELECT license_plate, COUNT(*) FROM sightings GROUP BY license_plate")
+        counts = dict(cursor.fetchall())
+        self._release(conn)
+
+        return counts
+
     def get_posted_sighting_count(self, license_plate: str) -> int:
         """Get the number of times a license plate has been posted (excludes current unposted sighting)."""
         conn = self._get_connection()
@@ -297,7 +443,7 @@ class SightingsDatabase:
         )
 
         count = cursor.fetchone()[0]
-        conn.close()
+        self._release(conn)
 
         return count
 
@@ -308,7 +454,18 @@ class SightingsDatabase:
 
         cursor.execute("SELECT COUNT(*) FROM sightings")
         count = cursor.fetchone()[0]
-        conn.close()
+        self._release(conn)
+
+        return count
+
+    def get_unposted_count(self) -> int:
+        """Get the number of sightings that haven't been posted yet."""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute("SELECT COUNT(*) FROM sightings WHERE post_uri IS NULL")
+        count = cursor.fetchone()[0]
+        self._release(conn)
 
         return count
 
@@ -325,7 +482,7 @@ class SightingsDatabase:
         )
 
         count = cursor.fetchone()[0]
-        conn.close()
+        self._release(conn)
 
         return count
 
@@ -345,33 +502,73 @@ class SightingsDatabase:
             cursor.execute("SELECT * FROM sightings ORDER BY timestamp DESC")
 
         sightings = cursor.fetchall()
-        conn.close()
+        self._release(conn)
 
         return sightings
 
-    def get_unposted_sightings(self):
+    def iter_all_sightings(self, license_plate: str = None, itersize: int = 2000):
+        """
+        Stream all sightings, optionally filtered by license plate.
+
+        Uses a named (server-side) cursor so rows are fetched in batches of
+        ``itersize`` instead of loading the whole table into memory.
+
+        Yields:
+            Sighting tuples in the same shape as get_all_sightings()
+        """
+        conn = self._get_connection()
+
+        try:
+            cursor = conn.cursor(name="stream_sightings")
+            cursor.itersize = itersize
+
+            if license_plate:
+                cursor.execute(
+                    """
+                    SELECT * FROM sightings WHERE license_plate = %s ORDER BY timestamp DESC
+                """,
+                    (license_plate,),
+                )
+            else:
+                cursor.execute("SELECT * FROM sightings ORDER BY timestamp DESC")
+
+            yield from cursor
+
+        finally:
+            self._release(conn)
+
+    def get_unposted_sightings(self, limit: int = None, distinct_plates: bool = False):
         """
-        Get all sightings that haven't been posted yet.
+        Get sightings that haven't been posted yet, oldest first.
 
-        Returns tuples with contributor info:
+        Args:
+            limit: Maximum number of sightings to return (default: all)
+            distinct_plates: Only return the oldest unposted sighting of each plate, so a
+                batch post doesn't spend two image slots on one vehicle
+
+        Returns named tuples with contributor info:
         (id, license_plate, timestamp, latitude, longitude, image_path, created_at, post_uri,
-         contributor_id, preferred_name, bluesky_handle, phone_number)
+         contributor_id, preferred_name, bluesky_handle, phone_number, image_basename)
         """
         conn = self._get_connection()
-        cursor = conn.cursor()
+        cursor = conn.cursor(cursor_factory=psycopg2.extras.NamedTupleCursor)
 
-        cursor.execute("""
-            SELECT s.id, s.license_plate, s.timestamp, s.latitude, s.longitude, s.image_path,
-                   s.created_at, s.post_uri, s.contributor_id,
-                   c.preferred_name, c.bluesky_handle, c.phone_number
-            FROM sightings s
-            LEFT JOIN contributors c ON s.contributor_id = c.id
-            WHERE s.post_uri IS NULL
-            ORDER BY s.timestamp ASC
-        """)
+        where = "WHERE s.post_uri IS NULL "
+        if distinct_plates:
+            where += """AND s.id IN (
+                SELECT DISTINCT ON (license_plate) id FROM sightings
+                WHERE post_uri IS NULL
+                ORDER BY license_plate, timestamp, id
+            ) """
+
+        # LIMIT NULL means no limit
+        cursor.execute(
+            SIGHTING_SELECT + where + "ORDER BY s.timestamp ASC LIMIT %s",
+            (limit,),
+        )
 
         sightings = cursor.fetchall()
-        conn.close()
+        self._release(conn)
 
         return sightings
 
@@ -395,7 +592,7 @@ class SightingsDatabase:
         )
 
         conn.commit()
-        conn.close()
+        self._release(conn)
 
     def mark_batch_as_posted(self, sighting_ids: list[int], post_uri: str):
         """
@@ -420,45 +617,92 @@ class SightingsDatabase:
         )
 
         conn.commit()
-        conn.close()
+        self._release(conn)
 
     # ==================== Statistics ====================
 
     def get_unique_sighted_count(self) -> int:
         """Get the count of unique license plates that have been sighted."""
+        # Not cached: sightings come in through other containers (the SMS webhook),
+        # whose inserts couldn't invalidate a cache held here
         conn = self._get_connection()
         cursor = conn.cursor()
 
         cursor.execute("SELECT COUNT(DISTINCT license_plate) FROM sightings")
         count = cursor.fetchone()[0]
-        conn.close()
+        self._release(conn)
 
         return count
 
-    def get_unique_posted_count(self) -> int:
-        """Get the count of unique license plates that have been posted."""
+    def get_posted_counts_by_plate(self) -> dict[str, int]:
+        """
+        Get the number of posted sightings for every plate that has been posted.
+
+        Returns:
+            Dict mapping license plate to posted sighting count. Its length is the
+            unique posted count.
+        """
         conn = self._get_connection()
         cursor = conn.cursor()
 
         cursor.execute(
-            "SELECT COUNT(DISTINCT license_plate) FROM sightings WHERE post_uri IS NOT NULL"
+            """
+            SELECT license_plate, COUNT(*) FROM sightings
+            WHERE post_uri IS NOT NULL
+            GROUP BY license_plate
+        """
         )
-        count = cursor.fetchone()[0]
-        conn.close()
+        counts = dict(cursor.fetchall())
+        self._release(conn)
 
-        return count
+        return counts
+
+    def get_all_stats(self) -> dict[str, int]:
+        """
+        Get every database statistic in a single query.
+
+        Returns:
+            Dict with total_sightings, unique_posted, unique_sighted, total_vehicles
+            and unposted counts
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute(
+            """
+            SELECT
+                (SELECT COUNT(*) FROM sightings),
+                (SELECT COUNT(DISTINCT license_plate) FROM sightings
+                 WHERE post_uri IS NOT NULL),
+                (SELECT COUNT(DISTINCT license_plate) FROM sightings),
+                (SELECT value FROM tlc_meta WHERE key = 'count'),
+                (SELECT COUNT(*) FROM sightings WHERE post_uri IS NULL)
+        """
+        )
+        total, unique_posted, unique_sighted, total_vehicles, unposted = cursor.fetchone()
+        self._release(conn)
+
+        return {
+            "total_sightings": total,
+            "unique_posted": unique_posted,
+            "unique_sighted": unique_sighted,
+            "total_vehicles": total_vehicles,
+            "unposted": unposted,
+        }
 
     # ==================== TLC Operations (delegated) ====================
     # These methods delegate to validate.tlc for backwards compatibility
 
+    @_ttl_cache(seconds=300)
     def get_tlc_vehicle_count(self) -> int:
         """Get total count of TLC vehicles in database."""
         conn = self._get_connection()
         cursor = conn.cursor()
 
-        cursor.execute("SELECT COUNT(*) FROM tlc_vehicles")
+        # Maintained by triggers on tlc_vehicles (migration 003)
+        cursor.execute("SELECT value FROM tlc_meta WHERE key = 'count'")
         count = cursor.fetchone()[0]
-        conn.close()
+        self._release(conn)
 
         return count
 
@@ -475,14 +719,14 @@ class SightingsDatabase:
         )
 
         vehicle = cursor.fetchone()
-        conn.close()
+        self._release(conn)
 
         return vehicle
 
     def search_plates_wildcard(self, pattern: str) -> list:
         """
         Search for license plates using wildcard pattern.
-        Use * for any number of characters.
+        Use * for any single character.
 
         Args:
             pattern: Search pattern like 'T73**580C' where * matches any character
@@ -490,29 +734,30 @@ class SightingsDatabase:
         Returns:
             List of matching vehicle records
         """
+        from validate.tlc import plate_pattern_condition
+
         conn = self._get_connection()
         cursor = conn.cursor()
 
-        # Convert * to SQL wildcard _
-        sql_pattern = pattern.replace("*", "_")
+        condition, param = plate_pattern_condition(pattern)
 
         cursor.execute(
-            """
+            f"""
             SELECT dmv_license_plate_number, vehicle_vin_number, vehicle_year,
                    name, base_name, base_type
             FROM tlc_vehicles
-            WHERE dmv_license_plate_number LIKE %s
+            WHERE {condition}
             ORDER BY dmv_license_plate_number
         """,
-            (sql_pattern,),
+            (param,),
         )
 
         results = cursor.fetchall()
-        conn.close()
+        self._release(conn)
 
         return results
 
-    def import_tlc_data(self, csv_path: str) -> int:
+    def import_tlc_data(self, csv_path: str, batch_size: int = 5000) -> int:
         """
         Import TLC vehicle data from CSV file.
         Delegates to validate.tlc.TLCDatabase for implementation.
@@ -520,7 +765,9 @@ class SightingsDatabase:
         from validate.tlc import TLCDatabase
 
         tlc_db = TLCDatabase(self.db_url)
-        return tlc_db.import_tlc_data(csv_path)
+        count = tlc_db.import_tlc_data(csv_path, batch_size=batch_size)
+        self._invalidate_counts("get_tlc_vehicle_count")
+        return count
 
     def filter_fisker_vehicles(self) -> int:
         """
@@ -530,4 +777,6 @@ class SightingsDatabase:
         from validate.tlc import TLCDatabase
 
         tlc_db = TLCDatabase(self.db_url)
-        return tlc_db.filter_fisker_vehicles()
+        count = tlc_db.filter_fisker_vehicles()
+        self._invalidate_counts("get_tlc_vehicle_count")
+        return count
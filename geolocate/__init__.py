@@ -2,7 +2,6 @@
 
 from .exif import extract_gps_from_exif, extract_timestamp_from_exif
 from .geocoding import Geocoder, geocode_address, reverse_geocode
-from .maps import generate_map
 
 __all__ = [
     "reverse_geocode",
@@ -12,3 +11,12 @@ __all__ = [
     "extract_gps_from_exif",
     "extract_timestamp_from_exif",
 ]
+
+
+def __getattr__(name):
+    # Maps pull in staticmap, so only load them when generate_map is first used
+    if name == "generate_map":
+        from .maps import generate_map
+
+        return generate_map
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,10 +1,37 @@
 """EXIF metadata extraction from images."""
 
+import io
+import logging
+import os
+import struct
 from datetime import datetime
+from pathlib import Path
 from typing import Any
 
 from PIL import Image
-from PIL.ExifTags import GPSTAGS, TAGS
+
+logger = logging.getLogger(__name__)
+
+# EXIF tag IDs for the only fields we consume
+TAG_DATETIME = 0x0132
+TAG_EXIF_IFD = 0x8769
+TAG_GPS_IFD = 0x8825
+TAG_DATETIME_ORIGINAL = 0x9003
+
+# GPS IFD tag IDs for the only GPS fields we consume
+_GPS_FIELDS = {
+    1: "GPSLatitudeRef",
+    2: "GPSLatitude",
+    3: "GPSLongitudeRef",
+    4: "GPSLongitude",
+}
+
+# File types that can carry EXIF; anything else skips straight to the no-EXIF fallback
+_EXIF_EXTS = frozenset({".jpg", ".jpeg", ".tif", ".tiff", ".heic", ".heif", ".webp", ".png"})
+
+_JPEG_SOI = b"\xff\xd8"
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_EXIF_HEADER = b"Exif\x00\x00"
 
 
 class ExifDataError(Exception):
@@ -13,25 +40,129 @@ class ExifDataError(Exception):
     pass
 
 
-def get_exif_data(image_path: str) -> dict:
-    """Extract EXIF data from an image."""
-    try:
-        image = Image.open(image_path)
-        exif_data = image._getexif()
+def _read_exif_segment(fp) -> bytes | None:
+    """
+    Read the raw EXIF block from a JPEG APP1 segment or PNG eXIf chunk.
 
-        if not exif_data:
-            raise ExifDataError(f"No EXIF data found in image: {image_path}")
+    Only segment headers are read until the EXIF block is found, so the
+    compressed image data is never touched.
 
-        exif = {}
-        for tag_id, value in exif_data.items():
-            tag = TAGS.get(tag_id, tag_id)
-            exif[tag] = value
+    Returns:
+        Raw EXIF bytes, or None if the file has no EXIF block
 
-        return exif
-    except AttributeError:
+    Raises:
+        ValueError: If the file is not a JPEG or PNG
+    """
+    signature = fp.read(8)
+
+    if signature.startswith(_JPEG_SOI):
+        fp.seek(2)
+        while True:
+            marker = fp.read(2)
+            if len(marker) < 2 or marker[0] != 0xFF:
+                return None
+            if marker[1] == 0xFF:
+                # Fill byte before the real marker
+                fp.seek(-1, os.SEEK_CUR)
+                continue
+            if marker[1] in (0xD9, 0xDA):
+                # End of image / start of scan: no metadata segments follow
+                return None
+
+            (length,) = struct.unpack(">H", fp.read(2))
+            if marker[1] == 0xE1:
+                data = fp.read(length - 2)
+                if data.startswith(_EXIF_HEADER):
+                    return data
+            else:
+                fp.seek(length - 2, os.SEEK_CUR)
+
+    if signature == _PNG_SIGNATURE:
+        while True:
+            chunk_header = fp.read(8)
+            if len(chunk_header) < 8:
+                return None
+            length, chunk_type = struct.unpack(">I4s", chunk_header)
+            if chunk_type == b"eXIf":
+                return fp.read(length)
+            if chunk_type == b"IEND":
+                return None
+            # Skip chunk data and CRC
+            fp.seek(length + 4, os.SEEK_CUR)
+
+    raise ValueError("Not a JPEG or PNG file")
+
+
+def _parse_exif_block(data: bytes) -> dict:
+    """Parse a raw EXIF block, keeping only the fields we consume."""
+    exif_data = Image.Exif()
+    exif_data.load(data)
+    return _select_exif_fields(exif_data)
+
+
+def _select_exif_fields(exif_data: Image.Exif) -> dict:
+    """Pull the fields we consume out of a PIL Exif mapping and its sub-IFDs."""
+    exif = {}
+    if TAG_DATETIME in exif_data:
+        exif["DateTime"] = exif_data[TAG_DATETIME]
+
+    exif_ifd = exif_data.get_ifd(TAG_EXIF_IFD)
+    if TAG_DATETIME_ORIGINAL in exif_ifd:
+        exif["DateTimeOriginal"] = exif_ifd[TAG_DATETIME_ORIGINAL]
+
+    gps_ifd = exif_data.get_ifd(TAG_GPS_IFD)
+    if gps_ifd:
+        exif["GPSInfo"] = dict(gps_ifd)
+
+    return exif
+
+
+def _get_exif_data_pil(image_path: str, data: bytes | None = None) -> dict:
+    """Extract EXIF fields by opening the image with PIL (slow path)."""
+    with Image.open(io.BytesIO(data) if data is not None else image_path) as image:
+        exif = _select_exif_fields(image.getexif())
+
+    if not exif:
         raise ExifDataError(f"No EXIF data found in image: {image_path}")
+
+    return exif
+
+
+def get_exif_data(image_path: str, data: bytes | None = None) -> dict:
+    """
+    Extract EXIF data from an image.
+
+    For JPEG and PNG files only the EXIF segment is read and parsed; other
+    formats (or malformed segments) fall back to opening the image with PIL.
+
+    Args:
+        image_path: Path to the image file
+        data: File contents, if already read (avoids opening the file again)
+
+    Returns:
+        dict with any of the keys GPSInfo, DateTimeOriginal, DateTime
+    """
+    try:
+        if data is not None:
+            block = _read_exif_segment(io.BytesIO(data))
+        else:
+            with open(image_path, "rb") as fp:
+                block = _read_exif_segment(fp)
+        if block is None:
+            raise ExifDataError(f"No EXIF data found in image: {image_path}")
+        exif = _parse_exif_block(block)
     except FileNotFoundError:
         raise ExifDataError(f"Image file not found: {image_path}")
+    except ExifDataError:
+        raise
+    except Exception:
+        # Unsupported container or malformed segment - let PIL have a go
+        exif = _get_exif_data_pil(image_path, data)
+
+    if not exif:
+        raise ExifDataError(f"No EXIF data found in image: {image_path}")
+
+    return exif
 
 
 def get_gps_data(exif: dict) -> dict:
@@ -39,18 +170,34 @@ def get_gps_data(exif: dict) -> dict:
     if "GPSInfo" not in exif:
         raise ExifDataError("No GPS data found in EXIF")
 
-    gps_info = {}
-    for key, value in exif["GPSInfo"].items():
-        decode = GPSTAGS.get(key, key)
-        gps_info[decode] = value
+    gps = exif["GPSInfo"]
+    return {name: gps[tag] for tag, name in _GPS_FIELDS.items() if tag in gps}
+
+
+_INV60 = 1.0 / 60.0
+_INV3600 = 1.0 / 3600.0
+
 
-    return gps_info
+def _to_float(value) -> float:
+    """Convert an EXIF rational (or plain number) to float without rational arithmetic."""
+    denominator = getattr(value, "denominator", None)
+    if denominator is not None:
+        return value.numerator / denominator if denominator else 0.0
+    return float(value)
 
 
 def convert_to_degrees(value) -> float:
     """Convert GPS coordinates to degrees in float format."""
     d, m, s = value
-    return d + (m / 60.0) + (s / 3600.0)
+    try:
+        # Common case: three EXIF rationals
+        return (
+            d.numerator / d.denominator
+            + (m.numerator / m.denominator) * _INV60
+            + (s.numerator / s.denominator) * _INV3600
+        )
+    except (AttributeError, ZeroDivisionError):
+        return _to_float(d) + _to_float(m) * _INV60 + _to_float(s) * _INV3600
 
 
 def get_coordinates(gps_info: dict) -> tuple[float, float]:
@@ -76,6 +223,18 @@ def get_timestamp(exif: dict) -> str:
     if not datetime_original:
         raise ExifDataError("No timestamp found in EXIF data")
 
+    # Fast path for the fixed-width EXIF format "YYYY:MM:DD HH:MM:SS"
+    s = datetime_original
+    if len(s) == 19 and s[4] == ":" and s[7] == ":" and s[10] == " ":
+        try:
+            # Constructing the datetime validates the fields (cameras write 0000:00:00 when unset)
+            datetime(
+                int(s[0:4]), int(s[5:7]), int(s[8:10]), int(s[11:13]), int(s[14:16]), int(s[17:19])
+            )
+            return f"{s[0:4]}-{s[5:7]}-{s[8:10]}T{s[11:]}"
+        except ValueError:
+            pass
+
     try:
         dt = datetime.strptime(datetime_original, "%Y:%m:%d %H:%M:%S")
         return dt.isoformat()
@@ -101,12 +260,25 @@ def extract_image_metadata(image_path: str, calculate_hashes: bool = True) -> di
 
     Note:
         If EXIF data or timestamp is missing, uses current time as fallback.
+        Files whose extension can't carry EXIF (e.g. .gif) skip EXIF parsing.
         GPS data is optional and will be None if not available.
         Hash calculation failures are logged but don't prevent metadata extraction.
     """
+    # When hashing, read the file once and share the bytes with EXIF parsing
+    data = None
+    if calculate_hashes:
+        try:
+            with open(image_path, "rb") as f:
+                data = f.read()
+        except OSError:
+            # Let EXIF parsing and hashing report the problem
+            pass
+
     # Try to get EXIF data, but don't fail if it's missing
     try:
-        exif = get_exif_data(image_path)
+        if Path(image_path).suffix.lower() not in _EXIF_EXTS:
+            raise ExifDataError(f"Image format does not carry EXIF data: {image_path}")
+        exif = get_exif_data(image_path, data)
     except ExifDataError:
         # No EXIF data - use current time and no GPS
         result: dict[str, Any] = {
@@ -117,7 +289,7 @@ def extract_image_metadata(image_path: str, calculate_hashes: bool = True) -> di
 
         # Calculate hashes even if EXIF is missing
         if calculate_hashes:
-            sha256, phash = _calculate_hashes_safe(image_path)
+            sha256, phash = _calculate_hashes_safe(image_path, data)
             result["image_hash_sha256"] = sha256
             result["image_hash_perceptual"] = phash
 
@@ -141,28 +313,45 @@ def extract_image_metadata(image_path: str, calculate_hashes: bool = True) -> di
 
     # Calculate image hashes if requested
     if calculate_hashes:
-        sha256, phash = _calculate_hashes_safe(image_path)
+        sha256, phash = _calculate_hashes_safe(image_path, data)
         result["image_hash_sha256"] = sha256
         result["image_hash_perceptual"] = phash
 
     return result
 
 
-def _calculate_hashes_safe(image_path: str) -> tuple[str | None, str | None]:
+def _calculate_hashes_safe(
+    image_path: str, data: bytes | None = None
+) -> tuple[str | None, str | None]:
     """
     Calculate image hashes with error handling.
 
+    Args:
+        image_path: Path to the image file
+        data: File contents, if already read
+
     Returns:
         Tuple of (sha256_hash, perceptual_hash), where either may be None on error
     """
     try:
-        from utils.image_hashing import calculate_both_hashes
+        from utils.image_hashing import (
+            ImageHashError,
+            calculate_both_hashes,
+            calculate_hashes_from_bytes,
+        )
+    except ImportError as e:
+        logger.warning("Failed to calculate hashes for %s: %s", image_path, e)
+        return None, None
+
+    try:
+        if data is not None:
+            return calculate_hashes_from_bytes(data, image_path)
 
         sha256, phash = calculate_both_hashes(image_path)
         return sha256, phash
-    except (ImportError, Exception) as e:
+    except (ImageHashError, OSError) as e:
         # Log error but don't fail metadata extraction
-        print(f"Warning: Failed to calculate hashes for {image_path}: {e}")
+        logger.warning("Failed to calculate hashes for %s: %s", image_path, e)
         return None, None
 
 
@@ -1,13 +1,51 @@
 """Reverse geocoding using Nominatim (OpenStreetMap)."""
 
+import json
+import queue
+import re
+import sqlite3
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from contextlib import closing
+from pathlib import Path
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Cache keys quantize coordinates to 5 decimal places (~1 m)
+COORD_SCALE = 100_000
+CACHE_MAXSIZE = 8192
+
+# Nominatim's usage policy allows at most one request per second
+MIN_REQUEST_INTERVAL = 1.0
+
+# Bounding box around the five boroughs (south, west, north, east)
+NYC_BOUNDS = (40.4774, -74.2591, 40.9176, -73.7004)
+
+
+def in_nyc_bounds(latitude: float, longitude: float) -> bool:
+    """Check whether coordinates fall within the NYC bounding box."""
+    south, west, north, east = NYC_BOUNDS
+    return south <= latitude <= north and west <= longitude <= east
 
 
 class Geocoder:
     """Reverse geocoding using Nominatim (OpenStreetMap)."""
 
+    # Reverse geocoding results shared by all instances, keyed by quantized coordinates.
+    # Background submit() lookups use it too, so every access holds _cache_lock.
+    _reverse_cache: OrderedDict[tuple[int, int], dict] = OrderedDict()
+    _cache_lock = threading.Lock()
+
+    # Earliest time.monotonic() the next Nominatim request may go out. Shared by all
+    # instances, so short-lived Geocoders (like the module-level helpers) can't
+    # together exceed the rate limit.
+    _next_request_at = 0.0
+    _rate_lock = threading.Lock()
+
     # NYC borough name mapping
     BOROUGH_MAP = {
         "Kings": "Brooklyn",
@@ -21,29 +59,194 @@ class Geocoder:
         "Richmond": "Staten Island",
         "Richmond County": "Staten Island",
     }
+    # Case-insensitive lookup into BOROUGH_MAP
+    _BOROUGH_MAP_LOWER = {name.lower(): borough for name, borough in BOROUGH_MAP.items()}
+    # Strips any remaining "Borough of" prefix or " County" suffix
+    _BOROUGH_CLEAN_RE = re.compile(r"^Borough of |(?: County)$")
+
+    def __init__(self, cache_dir: str | None = None):
+        """
+        Initialize the geocoder with Nominatim API.
 
-    def __init__(self):
-        """Initialize the geocoder with Nominatim API."""
+        Args:
+            cache_dir: Optional directory for a persistent SQLite cache of reverse
+                geocoding results. Results are always cached in memory.
+        """
         self.reverse_url = "https://nominatim.openstreetmap.org/reverse"
         self.search_url = "https://nominatim.openstreetmap.org/search"
         # Nominatim requires a user agent
         self.user_agent = "FiskerOceanSpotterBot/1.0"
-        self.last_request_time = 0
-        # Nominatim rate limit: 1 request per second
-        self.rate_limit_delay = 1.0
+        # Reuse one keep-alive connection to Nominatim across requests
+        self.session = requests.Session()
+        retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504])
+        self.session.mount(
+            "https://", HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=retries)
+        )
+        self.session.headers.update({"User-Agent": self.user_agent, "Accept-Language": "en"})
+
+        # Background lookup worker, started on demand by start_background()/submit()
+        self._queue: queue.Queue | None = None
+        self._worker: threading.Thread | None = None
+
+        self.cache_path = None
+        if cache_dir:
+            Path(cache_dir).mkdir(parents=True, exist_ok=True)
+            self.cache_path = Path(cache_dir) / "geocode_cache.sqlite"
+            with closing(sqlite3.connect(self.cache_path)) as conn, conn:
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS reverse_geocode (
+                        lat_q INTEGER NOT NULL,
+                        lon_q INTEGER NOT NULL,
+                        json TEXT NOT NULL,
+                        ts INTEGER NOT NULL,
+                        PRIMARY KEY (lat_q, lon_q)
+                    )
+                """
+                )
 
     def _respect_rate_limit(self):
-        """Ensure we don't exceed Nominatim's 1 request/second rate limit."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        if time_since_last < self.rate_limit_delay:
-            time.sleep(self.rate_limit_delay - time_since_last)
-        self.last_request_time = time.time()
+        """
+        Ensure we don't exceed Nominatim's 1 request/second rate limit.
+
+        Only sleeps for whatever is left of the interval since the last request, so
+        cache hits and time spent elsewhere count toward the wait.
+        """
+        with Geocoder._rate_lock:
+            now = time.monotonic()
+            wait = Geocoder._next_request_at - now
+            if wait > 0:
+                time.sleep(wait)
+                now += wait
+            Geocoder._next_request_at = now + MIN_REQUEST_INTERVAL
+
+    def start_background(self):
+        """Start a daemon thread that resolves submitted lookups in order."""
+        if self._worker is not None:
+            return
+
+        self._queue = queue.Queue()
+        self._worker = threading.Thread(target=self._background_loop, daemon=True)
+        self._worker.start()
+
+    def submit(self, latitude: float, longitude: float) -> Future:
+        """
+        Queue a neighborhood lookup on the background thread.
+
+        Lets callers start the (rate-limited) lookup early and only block on
+        future.result() when they need the name.
+
+        Args:
+            latitude: Latitude coordinate
+            longitude: Longitude coordinate
+
+        Returns:
+            Future resolving to the get_neighborhood_name() result
+        """
+        self.start_background()
+        future = Future()
+        self._queue.put((latitude, longitude, future))
+        return future
+
+    def _background_loop(self):
+        """Serve queued lookups until close() sends the stop sentinel."""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+
+            latitude, longitude, future = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(self.get_neighborhood_name(latitude, longitude))
+            except Exception as e:
+                future.set_exception(e)
+
+    def close(self, cancel_pending: bool = False):
+        """
+        Stop the background worker and close the HTTP session.
+
+        Args:
+            cancel_pending: Cancel queued lookups instead of waiting for them
+        """
+        if self._worker is not None:
+            while cancel_pending:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not None:
+                    item[2].cancel()
+            self._queue.put(None)
+            self._worker.join()
+            self._worker = None
+            self._queue = None
+
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @staticmethod
+    def _cache_key(latitude: float, longitude: float) -> tuple[int, int]:
+        """Quantize coordinates to an integer cache key."""
+        return round(latitude * COORD_SCALE), round(longitude * COORD_SCALE)
+
+    def _cache_get(self, key: tuple[int, int]) -> dict | None:
+        """Look up a cached reverse geocoding result in memory, then on disk."""
+        with Geocoder._cache_lock:
+            data = self._reverse_cache.get(key)
+            if data is not None:
+                self._reverse_cache.move_to_end(key)
+                return data
+
+        if self.cache_path is None:
+            return None
+
+        with closing(sqlite3.connect(self.cache_path)) as conn:
+            row = conn.execute(
+                "SELECT json FROM reverse_geocode WHERE lat_q = ? AND lon_q = ?", key
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        data = json.loads(row[0])
+        self._remember(key, data)
+        return data
+
+    def _cache_put(self, key: tuple[int, int], data: dict):
+        """Store a reverse geocoding result in memory and on disk."""
+        self._remember(key, data)
+
+        if self.cache_path is None:
+            return
+
+        with closing(sqlite3.connect(self.cache_path)) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO reverse_geocode (lat_q, lon_q, json, ts) VALUES (?, ?, ?, ?)",
+                (*key, json.dumps(data), int(time.time())),
+            )
+
+    def _remember(self, key: tuple[int, int], data: dict):
+        """Add a result to the in-memory LRU cache, evicting the oldest entry if full."""
+        with Geocoder._cache_lock:
+            self._reverse_cache[key] = data
+            self._reverse_cache.move_to_end(key)
+            if len(self._reverse_cache) > CACHE_MAXSIZE:
+                self._reverse_cache.popitem(last=False)
 
     def reverse_geocode(self, latitude: float, longitude: float) -> dict | None:
         """
         Reverse geocode coordinates to get address information.
 
+        Results are cached by coordinates rounded to ~1 m, so repeat lookups
+        skip both the network request and the rate limit wait.
+
         Args:
             latitude: Latitude coordinate
             longitude: Longitude coordinate
@@ -51,6 +254,11 @@ class Geocoder:
         Returns:
             Dictionary with address components, or None if lookup fails
         """
+        key = self._cache_key(latitude, longitude)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
         self._respect_rate_limit()
 
         params = {
@@ -61,16 +269,17 @@ class Geocoder:
             "zoom": 18,  # Higher zoom for more detailed addresses
         }
 
-        headers = {"User-Agent": self.user_agent}
-
         try:
-            response = requests.get(self.reverse_url, params=params, headers=headers, timeout=10)
+            response = self.session.get(self.reverse_url, params=params, timeout=10)
             response.raise_for_status()
-            return response.json()
+            data = response.json()
         except Exception:
             # If geocoding fails, return None and we'll fall back to coordinates
             return None
 
+        self._cache_put(key, data)
+        return data
+
     def get_neighborhood_name(self, latitude: float, longitude: float) -> str | None:
         """
         Get a human-readable neighborhood name for NYC coordinates.
@@ -82,8 +291,13 @@ class Geocoder:
             longitude: Longitude coordinate
 
         Returns:
-            Formatted neighborhood string, or None if lookup fails
+            Formatted neighborhood string, or None if lookup fails or the
+            coordinates are outside NYC
         """
+        # Skip the network round trip for locations that can't be in NYC
+        if not in_nyc_bounds(latitude, longitude):
+            return None
+
         data = self.reverse_geocode(latitude, longitude)
 
         if not data or "address" not in data:
@@ -110,9 +324,9 @@ class Geocoder:
             parts.append(neighborhood)
         if borough:
             # Map NYC county names to common borough names
-            borough_clean = self.BOROUGH_MAP.get(borough, borough)
+            borough_clean = self._BOROUGH_MAP_LOWER.get(borough.lower(), borough)
             # Also handle any remaining "Borough of" or "County" suffix
-            borough_clean = borough_clean.replace("Borough of ", "").replace(" County", "")
+            borough_clean = self._BOROUGH_CLEAN_RE.sub("", borough_clean)
             parts.append(borough_clean)
 
         if parts:
@@ -144,10 +358,8 @@ class Geocoder:
 
         params = {"q": search_query, "format": "json", "limit": 1, "countrycodes": "us"}
 
-        headers = {"User-Agent": self.user_agent}
-
         try:
-            response = requests.get(self.search_url, params=params, headers=headers, timeout=10)
+            response = self.session.get(self.search_url, params=params, timeout=10)
             response.raise_for_status()
             results = response.json()
 
@@ -169,8 +381,8 @@ def reverse_geocode(latitude: float, longitude: float) -> str:
 
     Returns neighborhood name or "Unknown location" if lookup fails.
     """
-    geocoder = Geocoder()
-    result = geocoder.get_neighborhood_name(latitude, longitude)
+    with Geocoder() as geocoder:
+        result = geocoder.get_neighborhood_name(latitude, longitude)
     return result or "Unknown location"
 
 
@@ -180,5 +392,5 @@ def geocode_address(address: str) -> tuple[float, float] | None:
 
     Returns (latitude, longitude) or None if lookup fails.
     """
-    geocoder = Geocoder()
-    return geocoder.geocode_address(address)
+    with Geocoder() as geocoder:
+        return geocoder.geocode_address(address)
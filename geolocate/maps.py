@@ -1,9 +1,50 @@
 """Map generation using OpenStreetMap tiles via staticmap."""
 
+import hashlib
+import os
+import shutil
+import threading
+import time
 from pathlib import Path
+from urllib.parse import urlparse
 
+import requests
 from staticmap import CircleMarker, StaticMap
 
+# Downloaded OSM tiles are reused for this long before being fetched again
+TILE_MAX_AGE = 30 * 24 * 3600
+
+# Keep-alive session shared by all tile downloads
+_tile_session = requests.Session()
+
+
+class CachedTileMap(StaticMap):
+    """StaticMap that fetches OSM tiles through a shared on-disk tile cache."""
+
+    def __init__(self, width: int, height: int, tile_dir: Path, **kwargs):
+        super().__init__(width, height, **kwargs)
+        self.tile_dir = tile_dir
+
+    def get(self, url, **kwargs):
+        """Return (status_code, content) for a tile, from disk when cached."""
+        # Tile URLs end in {z}/{x}/{y}.png, which doubles as the cache layout
+        tile_path = self.tile_dir / urlparse(url).path.lstrip("/")
+        try:
+            if time.time() - tile_path.stat().st_mtime < TILE_MAX_AGE:
+                return 200, tile_path.read_bytes()
+        except FileNotFoundError:
+            pass
+
+        response = _tile_session.get(url, **kwargs)
+        if response.status_code == 200:
+            tile_path.parent.mkdir(parents=True, exist_ok=True)
+            # staticmap fetches tiles from several threads, so use a per-thread temp file
+            tmp_path = tile_path.with_suffix(f".{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(response.content)
+            os.replace(tmp_path, tile_path)
+
+        return response.status_code, response.content
+
 
 class MapGenerator:
     """Generate static map images using OpenStreetMap tiles."""
@@ -17,6 +58,7 @@ class MapGenerator:
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
+        self.tile_dir = self.cache_dir / "tiles"
 
     def generate_map(
         self,
@@ -31,6 +73,8 @@ class MapGenerator:
         Generate a static map image centered on the given coordinates.
 
         Uses the staticmap library to fetch and stitch OpenStreetMap tiles.
+        Rendered maps are cached in cache_dir by location, zoom and size, so
+        repeat requests skip the tile downloads entirely.
 
         Args:
             latitude: Center latitude
@@ -43,23 +87,48 @@ class MapGenerator:
         Returns:
             Path to the generated map image
         """
-        # Create a static map
-        m = StaticMap(width, height)
-
-        # Add a marker at the location
-        marker = CircleMarker((longitude, latitude), "red", 12)
-        m.add_marker(marker)
+        # Coordinates rounded to ~1 m keep the marker within a pixel of its true position
+        key = hashlib.sha1(
+            f"{round(latitude, 5)}_{round(longitude, 5)}_{zoom}_{width}_{height}".encode()
+        ).hexdigest()[:16]
+        cache_path = self.cache_dir / f"map_{key}.png"
+
+        if not cache_path.exists():
+            # Create a static map
+            m = CachedTileMap(width, height, tile_dir=self.tile_dir)
+
+            # Add a marker at the location
+            marker = CircleMarker((longitude, latitude), "red", 12)
+            m.add_marker(marker)
+
+            # Render the map image, writing via a temp file so readers never see a partial PNG.
+            # optimize picks the smallest lossless encoding, which matters for maps kept on
+            # the Modal volume.
+            image = m.render(zoom=zoom)
+            # Maps are rendered from several threads, so use a per-thread temp file
+            tmp_path = cache_path.with_suffix(f".{threading.get_ident()}.tmp")
+            image.save(str(tmp_path), format="PNG", optimize=True)
+            os.replace(tmp_path, cache_path)
 
-        # Determine output path
         if output_path is None:
-            filename = f"map_{latitude}_{longitude}_{zoom}.png"
-            output_path = self.cache_dir / filename
-        else:
-            output_path = Path(output_path)
-
-        # Render the map image
-        image = m.render(zoom=zoom)
-        image.save(str(output_path))
+            return str(cache_path)
+
+        # Another thread may be linking the same location at the same time, so an
+        # output that's already gone, or already linked, counts as done
+        output_path = Path(output_path)
+        try:
+            # Same location requested again - already linked to the cached render
+            if os.path.samefile(output_path, cache_path):
+                return str(output_path)
+            output_path.unlink()
+        except FileNotFoundError:
+            pass
+        try:
+            os.link(cache_path, output_path)
+        except FileExistsError:
+            pass
+        except OSError:
+            shutil.copyfile(cache_path, output_path)
 
         return str(output_path)
 
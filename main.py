@@ -1,3 +1,4 @@
+import os
 import subprocess
 import sys
 from pathlib import Path
@@ -10,6 +11,9 @@ from database import SightingsDatabase
 # Load environment variables from .env file
 load_dotenv()
 
+# Image file extensions batch-process picks up (lowercase, without the dot)
+IMAGE_EXTENSIONS = frozenset({"jpg", "jpeg", "png", "gif"})
+
 
 @click.group()
 def cli():
@@ -17,6 +21,75 @@ def cli():
     pass
 
 
+def _resolve_plate(db, raw: str) -> str | None:
+    """
+    Turn a typed license plate into the plate to record, prompting on wildcards.
+
+    Exact plates are checked with a single TLC lookup. Patterns containing *
+    are searched and the user picks one of the matching TLC plates.
+
+    Args:
+        db: SightingsDatabase, or anything with its TLC lookup methods
+        raw: Plate as typed, optionally with * wildcards (e.g. T73**580C)
+
+    Returns:
+        The plate to use, or None if the user didn't settle on one
+    """
+    license_plate = raw.upper()
+
+    if "*" not in license_plate:
+        if not db.get_tlc_vehicle_by_plate(license_plate):
+            click.echo(f"Warning: Plate {license_plate} not found in TLC database")
+            if not click.confirm("Continue anyway?", default=False):
+                return None
+        return license_plate
+
+    click.echo(f"\nSearching for plates matching pattern: {license_plate}")
+    results = db.search_plates_wildcard(license_plate)
+
+    if not results:
+        click.echo(f"No plates found matching pattern: {license_plate}")
+        return None
+
+    click.echo(f"\nFound {len(results)} matching plate(s):\n")
+
+    for idx, result in enumerate(results, 1):
+        plate, vin, year, owner, base_name, base_type = result
+        click.echo(f"{idx}. {plate} - {year} (VIN: {vin})")
+        click.echo(f"   Owner: {owner}")
+        click.echo(f"   Base: {base_name}")
+        click.echo()
+
+    # Plates offered here come from the TLC table, so they need no further check
+    if len(results) == 1:
+        if click.confirm(f"Use plate {results[0][0]}?", default=True):
+            return results[0][0]
+        return None
+
+    selection = click.prompt(
+        f"Select plate number (1-{len(results)}) or press Enter to cancel",
+        type=str,
+        default="",
+    )
+
+    if not selection:
+        return None
+
+    try:
+        idx = int(selection) - 1
+    except ValueError:
+        click.echo("Invalid input")
+        return None
+
+    if not 0 <= idx < len(results):
+        click.echo("Invalid selection")
+        return None
+
+    license_plate = results[idx][0]
+    click.echo(f"\nSelected: {license_plate}")
+    return license_plate
+
+
 @cli.command()
 @click.argument("image_path", type=click.Path(exists=True))
 @click.argument("license_plate")
@@ -35,52 +108,10 @@ def process(image_path: str, license_plate: str):
 
         db = SightingsDatabase()
 
-        # Check if license plate contains wildcards
-        if "*" in license_plate:
-            click.echo(f"\nSearching for plates matching pattern: {license_plate}")
-            results = db.search_plates_wildcard(license_plate.upper())
-
-            if not results:
-                click.echo(f"Error: No plates found matching pattern: {license_plate}", err=True)
-                raise click.Abort()
-
-            click.echo(f"\nFound {len(results)} matching plate(s):\n")
-
-            # Display options
-            for idx, result in enumerate(results, 1):
-                plate, vin, year, owner, base_name, base_type = result
-                click.echo(f"{idx}. {plate} - {year} (VIN: {vin})")
-                click.echo(f"   Owner: {owner}")
-                click.echo(f"   Base: {base_name}")
-                click.echo()
-
-            # Prompt for selection
-            if len(results) == 1:
-                if click.confirm(f"Use plate {results[0][0]}?", default=True):
-                    license_plate = results[0][0]
-                else:
-                    click.echo("Operation cancelled.")
-                    raise click.Abort()
-            else:
-                selection = click.prompt(
-                    f"Select plate number (1-{len(results)}) or 'q' to quit", type=str
-                )
-
-                if selection.lower() == "q":
-                    click.echo("Operation cancelled.")
-                    raise click.Abort()
-
-                try:
-                    idx = int(selection) - 1
-                    if 0 <= idx < len(results):
-                        license_plate = results[idx][0]
-                        click.echo(f"\nSelected: {license_plate}")
-                    else:
-                        click.echo("Error: Invalid selection", err=True)
-                        raise click.Abort()
-                except ValueError:
-                    click.echo("Error: Invalid input", err=True)
-                    raise click.Abort()
+        license_plate = _resolve_plate(db, license_plate)
+        if license_plate is None:
+            click.echo("Operation cancelled.")
+            raise click.Abort()
 
         metadata = extract_image_metadata(image_path)
         click.echo("\n✓ Extracted EXIF data:")
@@ -140,34 +171,57 @@ def process(image_path: str, license_plate: str):
 def list_sightings(plate: str = None):
     """List all sightings in the database."""
     db = SightingsDatabase()
-    sightings = db.get_all_sightings(plate)
 
-    if not sightings:
+    # Stream rows from a server-side cursor so large tables aren't loaded into memory
+    count = 0
+    for sighting in db.iter_all_sightings(plate):
+        count += 1
+        # One write per sighting rather than one per line
+        click.echo(
+            f"ID: {sighting[0]}\n"
+            f"  License Plate: {sighting[1]}\n"
+            f"  Timestamp: {sighting[2]}\n"
+            f"  Location: {sighting[3]}, {sighting[4]}\n"
+            f"  Image: {sighting[5]}\n"
+            f"  Recorded: {sighting[6]}\n"
+        )
+
+    if not count:
         if plate:
             click.echo(f"No sightings found for license plate: {plate}")
         else:
             click.echo("No sightings in database")
         return
 
-    click.echo(f"Found {len(sightings)} sighting(s):\n")
-    for sighting in sightings:
-        click.echo(f"ID: {sighting[0]}")
-        click.echo(f"  License Plate: {sighting[1]}")
-        click.echo(f"  Timestamp: {sighting[2]}")
-        click.echo(f"  Location: {sighting[3]}, {sighting[4]}")
-        click.echo(f"  Image: {sighting[5]}")
-        click.echo(f"  Recorded: {sighting[6]}\n")
+    click.echo(f"Found {count} sighting(s)")
+
+
+@cli.command()
+def migrate_db():
+    """Apply database migrations (indexes and columns) from database/migrations."""
+    try:
+        db = SightingsDatabase()
+        applied = db.apply_migrations()
+
+        for name in applied:
+            click.echo(f"✓ {name}")
+        click.echo(f"Applied {len(applied)} migration(s)")
+
+    except Exception as e:
+        click.echo(f"Error applying migrations: {e}", err=True)
+        raise click.Abort()
 
 
 @cli.command()
 @click.argument("csv_path", type=click.Path(exists=True))
-def import_tlc(csv_path: str):
+@click.option("--batch-size", type=int, default=5000, help="Rows per COPY batch (default: 5000)")
+def import_tlc(csv_path: str, batch_size: int = 5000):
     """Import NYC TLC vehicle data from CSV file."""
     try:
         click.echo(f"Importing TLC data from: {csv_path}")
         db = SightingsDatabase()
 
-        count = db.import_tlc_data(csv_path)
+        count = db.import_tlc_data(csv_path, batch_size=batch_size)
 
         click.echo(f"✓ Successfully imported {count:,} TLC vehicle records")
         click.echo(f"  - Total vehicles in database: {db.get_tlc_vehicle_count():,}")
@@ -276,42 +330,29 @@ def post(sighting_id: int):
 
     try:
         db = SightingsDatabase()
-
-        import sqlite3
-
-        conn = sqlite3.connect(db.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT * FROM sightings WHERE id = ?", (sighting_id,))
-        sighting = cursor.fetchone()
-        conn.close()
+        sighting = db.get_sighting_by_id(sighting_id)
 
         if not sighting:
             click.echo(f"Error: No sighting found with ID {sighting_id}", err=True)
             raise click.Abort()
 
         # Unpack sighting data
-        # Schema: id, license_plate, timestamp, latitude, longitude, image_path, created_at, post_uri, contributor_id, preferred_name, bluesky_handle, phone_number
-        sighting_id = sighting[0]
-        license_plate = sighting[1]
-        timestamp = sighting[2]
-        latitude = sighting[3]
-        longitude = sighting[4]
-        image_path = sighting[5]
-        # sighting[6] is created_at
-        # sighting[7] is post_uri
-        # sighting[8] is contributor_id (not used here)
-        preferred_name = sighting[9]
-        bluesky_handle = sighting[10]
-
-        db = SightingsDatabase()
-
-        # Use posted count for accurate numbering
-        posted_count = db.get_posted_sighting_count(license_plate)
+        sighting_id = sighting.id
+        license_plate = sighting.license_plate
+        timestamp = sighting.timestamp
+        latitude = sighting.latitude
+        longitude = sighting.longitude
+        image_path = sighting.image_path
+        preferred_name = sighting.preferred_name
+        bluesky_handle = sighting.bluesky_handle
+
+        # Use posted count for accurate numbering (one query gives both counts)
+        posted_counts = db.get_posted_counts_by_plate()
+        posted_count = posted_counts.get(license_plate, 0)
         sighting_count = posted_count + 1
 
         # For unique count: get posted unique count, and add 1 if this plate hasn't been posted before
-        unique_posted = db.get_unique_posted_count()
+        unique_posted = len(posted_counts)
         if posted_count == 0:
             unique_sighted = unique_posted + 1
         else:
@@ -328,15 +369,7 @@ def post(sighting_id: int):
 
         bluesky = BlueskyClient()
 
-        # Generate map only if GPS coordinates are available
-        map_path = None
-        if latitude is not None and longitude is not None:
-            click.echo("\nGenerating map image...")
-            map_gen = MapGenerator()
-            map_path = map_gen.generate_sighting_map(
-                latitude=latitude, longitude=longitude, license_plate=license_plate
-            )
-            click.echo(f"✓ Map saved to: {map_path}")
+        has_location = latitude is not None and longitude is not None
 
         post_text = bluesky.format_sighting_text(
             license_plate=license_plate,
@@ -355,14 +388,24 @@ def post(sighting_id: int):
         click.echo(post_text)
         click.echo("\nImages:")
         click.echo(f"  1. {image_path}")
-        if map_path:
-            click.echo(f"  2. {map_path}")
+        if has_location:
+            click.echo("  2. Map of the sighting location")
         click.echo("=" * 60 + "\n")
 
         if not click.confirm("Do you want to post this to Bluesky?"):
             click.echo("Post cancelled.")
             return
 
+        # Only render the map (tile downloads + drawing) once the post is confirmed
+        map_path = None
+        if has_location:
+            click.echo("\nGenerating map image...")
+            map_gen = MapGenerator()
+            map_path = map_gen.generate_sighting_map(
+                latitude=latitude, longitude=longitude, license_plate=license_plate
+            )
+            click.echo(f"✓ Map saved to: {map_path}")
+
         click.echo("\nPosting to Bluesky...")
 
         # Build images list - include map only if it exists
@@ -417,6 +460,10 @@ def batch_process(images_dir: str, preview: bool):
     - Generates map
     - Does NOT post to Bluesky (use batch-post for that)
     """
+    from concurrent.futures import ProcessPoolExecutor
+    from functools import lru_cache
+    from types import SimpleNamespace
+
     from geolocate.exif import extract_image_metadata
     from geolocate.maps import MapGenerator
 
@@ -424,29 +471,35 @@ def batch_process(images_dir: str, preview: bool):
         db = SightingsDatabase()
         images_path = Path(images_dir)
 
+        # The TLC table doesn't change during a run, so repeat lookups can skip the database
+        tlc = SimpleNamespace(
+            get_tlc_vehicle_by_plate=lru_cache(maxsize=4096)(db.get_tlc_vehicle_by_plate),
+            search_plates_wildcard=lru_cache(maxsize=256)(db.search_plates_wildcard),
+        )
+
         if not images_path.exists():
             click.echo(f"Error: Images directory not found: {images_dir}", err=True)
             raise click.Abort()
 
-        # Get all image files
-        image_extensions = {".jpg", ".jpeg", ".png", ".gif"}
-        all_images = [f for f in images_path.glob("*") if f.suffix.lower() in image_extensions]
+        # Get all image files, as name -> path strings
+        # scandir's entries carry the name and file type, so there's no stat() per entry
+        with os.scandir(images_path) as entries:
+            all_images = {
+                entry.name: entry.path
+                for entry in entries
+                if "." in entry.name
+                and entry.name.rpartition(".")[2].lower() in IMAGE_EXTENSIONS
+                and entry.is_file()
+            }
 
         if not all_images:
             click.echo(f"No images found in {images_dir}")
             return
 
-        # Get already processed images from database
-        import sqlite3
-
-        conn = sqlite3.connect(db.db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT image_path FROM sightings")
-        processed_paths = {Path(row[0]).name for row in cursor.fetchall()}
-        conn.close()
-
-        # Find unprocessed images
-        unprocessed = [img for img in all_images if img.name not in processed_paths]
+        # Find images that don't have a sighting in the database yet; only those
+        # (usually a handful) need Path objects
+        unprocessed_names = db.list_unprocessed_image_names(list(all_images))
+        unprocessed = [Path(path) for name, path in all_images.items() if name in unprocessed_names]
 
         if not unprocessed:
             click.echo(f"✓ All images in {images_dir} have been processed!")
@@ -468,181 +521,161 @@ def batch_process(images_dir: str, preview: bool):
             f"\nFound {len(unprocessed)} unprocessed image(s) out of {len(all_images)} total\n"
         )
 
-        for idx, image_path in enumerate(unprocessed, 1):
-            click.echo(f"\n{'='*60}")
-            click.echo(f"Processing image {idx}/{len(unprocessed)}: {image_path.name}")
-            click.echo(f"{'='*60}\n")
+        map_gen = MapGenerator()
 
-            # Open image for user to view
-            try:
-                if sys.platform == "darwin":  # macOS
-                    subprocess.run(["open", str(image_path)], check=True)
-                elif sys.platform == "win32":  # Windows
-                    subprocess.run(["start", str(image_path)], shell=True, check=True)
-                else:  # Linux
-                    subprocess.run(["xdg-open", str(image_path)], check=True)
-            except Exception as e:
-                click.echo(f"Warning: Could not open image: {e}")
-
-            # Prompt for license plate with validation loop
-            while True:
-                license_plate = click.prompt("Enter license plate (or 's' to skip, 'q' to quit)")
-
-                if license_plate.lower() == "q":
-                    click.echo("Batch processing cancelled.")
-                    return
-
-                if license_plate.lower() == "s":
-                    click.echo("Skipping this image.\n")
-                    break
+        # Extract EXIF and hashes in background processes while plates are being entered
+        executor = ProcessPoolExecutor()
+        try:
+            metadata_futures = {
+                img: executor.submit(extract_image_metadata, str(img)) for img in unprocessed
+            }
 
-                license_plate = license_plate.upper()
+            if sys.platform == "darwin":  # macOS
+                opener = ["open"]
+            elif sys.platform == "win32":  # Windows ("" is start's window title)
+                opener = ["cmd", "/c", "start", ""]
+            else:  # Linux
+                opener = ["xdg-open"]
 
-                # Check if contains wildcards
-                if "*" in license_plate:
-                    click.echo(f"\nSearching for plates matching pattern: {license_plate}")
-                    results = db.search_plates_wildcard(license_plate)
+            # Sighting counts for every plate in one query, kept up to date as sightings are saved
+            sighting_counts = db.get_sighting_counts_by_plate()
 
-                    if not results:
-                        click.echo(f"No plates found matching pattern: {license_plate}")
-                        continue
+            for idx, image_path in enumerate(unprocessed, 1):
+                click.echo(f"\n{'='*60}")
+                click.echo(f"Processing image {idx}/{len(unprocessed)}: {image_path.name}")
+                click.echo(f"{'='*60}\n")
 
-                    click.echo(f"\nFound {len(results)} matching plate(s):\n")
+                # Open image for user to view, without waiting for the viewer
+                try:
+                    subprocess.Popen(
+                        [*opener, str(image_path)],
+                        stdin=subprocess.DEVNULL,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                        start_new_session=True,
+                    )
+                except Exception as e:
+                    click.echo(f"Warning: Could not open image: {e}")
 
-                    for result_idx, result in enumerate(results, 1):
-                        plate, vin, year, owner, base_name, base_type = result
-                        click.echo(f"{result_idx}. {plate} - {year} (VIN: {vin})")
-                        click.echo(f"   Owner: {owner}")
-                        click.echo(f"   Base: {base_name}")
-                        click.echo()
+                # Prompt for license plate with validation loop
+                while True:
+                    license_plate = click.prompt(
+                        "Enter license plate (or 's' to skip, 'q' to quit)"
+                    )
 
-                    if len(results) == 1:
-                        if click.confirm(f"Use plate {results[0][0]}?", default=True):
-                            license_plate = results[0][0]
-                        else:
-                            continue
-                    else:
-                        selection = click.prompt(
-                            f"Select plate number (1-{len(results)}) or press Enter to re-enter",
-                            type=str,
-                            default="",
-                        )
+                    if license_plate.lower() == "q":
+                        click.echo("Batch processing cancelled.")
+                        return
 
-                        if not selection:
-                            continue
-
-                        try:
-                            sel_idx = int(selection) - 1
-                            if 0 <= sel_idx < len(results):
-                                license_plate = results[sel_idx][0]
-                            else:
-                                click.echo("Invalid selection")
-                                continue
-                        except ValueError:
-                            click.echo("Invalid input")
-                            continue
-
-                # Verify plate exists in TLC database
-                vehicle = db.get_tlc_vehicle_by_plate(license_plate)
-                if not vehicle:
-                    click.echo(f"Warning: Plate {license_plate} not found in TLC database")
-                    if not click.confirm("Continue anyway?", default=False):
+                    if license_plate.lower() == "s":
+                        click.echo("Skipping this image.\n")
+                        break
+
+                    resolved = _resolve_plate(tlc, license_plate)
+                    if resolved is None:
                         continue
 
-                # Valid plate - break out of validation loop
-                break
+                    license_plate = resolved
+                    break
 
-            # Skip if user chose to skip this image
-            if isinstance(license_plate, str) and license_plate.lower() == "s":
-                continue
+                # Skip if user chose to skip this image
+                if isinstance(license_plate, str) and license_plate.lower() == "s":
+                    continue
 
-            # Extract EXIF and process
-            try:
-                metadata = extract_image_metadata(str(image_path))
+                # Extract EXIF and process
+                try:
+                    metadata = metadata_futures[image_path].result()
 
-                # Show what data we extracted
-                click.echo("\n✓ Extracted metadata:")
-                click.echo(f"  - Timestamp: {metadata['timestamp']}")
+                    # Show what data we extracted
+                    click.echo("\n✓ Extracted metadata:")
+                    click.echo(f"  - Timestamp: {metadata['timestamp']}")
 
-                if metadata["latitude"] and metadata["longitude"]:
-                    click.echo(f"  - Location: {metadata['latitude']}, {metadata['longitude']}")
-                else:
-                    click.echo(
-                        "  - Location: No GPS data available (using current time as timestamp)"
-                    )
+                    if metadata["latitude"] and metadata["longitude"]:
+                        click.echo(f"  - Location: {metadata['latitude']}, {metadata['longitude']}")
+                    else:
+                        click.echo(
+                            "  - Location: No GPS data available (using current time as timestamp)"
+                        )
 
-                # Prompt for optional contributor name
-                contributed_by = click.prompt(
-                    "\nContributor name (optional, press Enter to skip)",
-                    default="",
-                    show_default=False,
-                )
+                    # Prompt for optional contributor name
+                    contributed_by = click.prompt(
+                        "\nContributor name (optional, press Enter to skip)",
+                        default="",
+                        show_default=False,
+                    )
 
-                # Get or create contributor
-                if contributed_by.strip():
-                    contributed_by = contributed_by.strip()
-                    # Check if it's a Bluesky handle
-                    if contributed_by.startswith("@"):
-                        contributor_id = db.get_or_create_contributor(bluesky_handle=contributed_by)
+                    # Get or create contributor
+                    if contributed_by.strip():
+                        contributed_by = contributed_by.strip()
+                        # Check if it's a Bluesky handle
+                        if contributed_by.startswith("@"):
+                            contributor_id = db.get_or_create_contributor(
+                                bluesky_handle=contributed_by
+                            )
+                        else:
+                            # For non-handle names, just use the default contributor
+                            # and note the name in console (not stored separately in this flow)
+                            click.echo(
+                                f"  Note: Name '{contributed_by}' recorded for this sighting"
+                            )
+                            contributor_id = 1
                     else:
-                        # For non-handle names, just use the default contributor
-                        # and note the name in console (not stored separately in this flow)
-                        click.echo(f"  Note: Name '{contributed_by}' recorded for this sighting")
+                        # Use default contributor (ID 1)
                         contributor_id = 1
-                else:
-                    # Use default contributor (ID 1)
-                    contributor_id = 1
-
-                # Save to database
-                result = db.add_sighting(
-                    license_plate=license_plate,
-                    timestamp=metadata["timestamp"],
-                    latitude=metadata["latitude"],
-                    longitude=metadata["longitude"],
-                    image_path=str(image_path.absolute()),
-                    contributor_id=contributor_id,
-                    image_hash_sha256=metadata.get("image_hash_sha256"),
-                    image_hash_perceptual=metadata.get("image_hash_perceptual"),
-                )
 
-                if result is None:
-                    click.echo("⚠️  This exact image has already been submitted to the database")
-                    continue
-
-                sighting_id = result["id"]
-
-                # Warn if similar image detected
-                if result["duplicate_type"] == "similar":
-                    dup_info = result["duplicate_info"]
-                    click.echo(
-                        f"⚠️  Similar image detected (sighting #{dup_info['id']}, "
-                        f"similarity: {100 - (dup_info['distance'] * 100 / 64):.0f}%)"
+                    # Save to database
+                    result = db.add_sighting(
+                        license_plate=license_plate,
+                        timestamp=metadata["timestamp"],
+                        latitude=metadata["latitude"],
+                        longitude=metadata["longitude"],
+                        image_path=str(image_path.absolute()),
+                        contributor_id=contributor_id,
+                        image_hash_sha256=metadata.get("image_hash_sha256"),
+                        image_hash_perceptual=metadata.get("image_hash_perceptual"),
                     )
-                    click.echo("  Continuing with submission...")
 
-                click.echo(f"✓ Sighting saved to database (ID: {sighting_id})")
+                    if result is None:
+                        click.echo("⚠️  This exact image has already been submitted to the database")
+                        continue
 
-                # Show sighting count
-                sighting_count = db.get_sighting_count(license_plate)
-                click.echo(f"  - This is sighting #{sighting_count} for {license_plate}")
+                    sighting_id = result["id"]
 
-                # Generate map only if GPS data is available
-                if metadata["latitude"] and metadata["longitude"]:
-                    click.echo("\nGenerating map image...")
-                    map_gen = MapGenerator()
-                    map_path = map_gen.generate_sighting_map(
-                        latitude=metadata["latitude"],
-                        longitude=metadata["longitude"],
-                        license_plate=license_plate,
-                    )
-                    click.echo(f"✓ Map saved to: {map_path}")
+                    # Warn if similar image detected
+                    if result["duplicate_type"] == "similar":
+                        dup_info = result["duplicate_info"]
+                        click.echo(
+                            f"⚠️  Similar image detected (sighting #{dup_info['id']}, "
+                            f"similarity: {100 - (dup_info['distance'] * 100 / 64):.0f}%)"
+                        )
+                        click.echo("  Continuing with submission...")
+
+                    click.echo(f"✓ Sighting saved to database (ID: {sighting_id})")
+
+                    # Show sighting count
+                    sighting_count = sighting_counts.get(license_plate, 0) + 1
+                    sighting_counts[license_plate] = sighting_count
+                    click.echo(f"  - This is sighting #{sighting_count} for {license_plate}")
+
+                    # Generate map only if GPS data is available
+                    if metadata["latitude"] and metadata["longitude"]:
+                        click.echo("\nGenerating map image...")
+                        map_path = map_gen.generate_sighting_map(
+                            latitude=metadata["latitude"],
+                            longitude=metadata["longitude"],
+                            license_plate=license_plate,
+                        )
+                        click.echo(f"✓ Map saved to: {map_path}")
 
-                click.echo("✓ Sighting ready to post (use batch-post command)\n")
+                    click.echo("✓ Sighting ready to post (use batch-post command)\n")
 
-            except Exception as e:
-                click.echo(f"Unexpected error: {e}", err=True)
-                if not click.confirm("Continue with next image?", default=True):
-                    return
+                except Exception as e:
+                    click.echo(f"Unexpected error: {e}", err=True)
+                    if not click.confirm("Continue with next image?", default=True):
+                        return
+        finally:
+            # Don't wait for images we never got to (e.g. after quitting)
+            executor.shutdown(cancel_futures=True)
 
         click.echo(f"\n{'='*60}")
         click.echo("Batch processing complete!")
@@ -669,21 +702,25 @@ def batch_post(limit: int = None, preview: bool = False):
     - Posts to Bluesky with confirmation (default: Yes)
     - Records post_uri in database
     """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from geolocate.geocoding import Geocoder
     from geolocate.maps import MapGenerator
     from post.bluesky import BlueskyClient
 
     try:
         db = SightingsDatabase()
-        unposted = db.get_unposted_sightings()
+        # Only fetch the rows this run will use; count the rest only if some were left out
+        unposted = db.get_unposted_sightings(limit=limit or None)
 
         if not unposted:
             click.echo("✓ No unposted sightings found!")
             return
 
-        # Apply limit if specified
         total_unposted = len(unposted)
+        if limit and total_unposted == limit:
+            total_unposted = db.get_unposted_count()
         if limit and limit < total_unposted:
-            unposted = unposted[:limit]
             limit_msg = f", showing first {limit}" if preview else f", processing first {limit}"
             click.echo(f"\nFound {total_unposted} unposted sighting(s){limit_msg}\n")
         else:
@@ -696,142 +733,165 @@ def batch_post(limit: int = None, preview: bool = False):
             click.echo("PREVIEW: Sightings that would be posted")
             click.echo(f"{'='*60}\n")
             for idx, sighting in enumerate(unposted, 1):
-                # Schema: id, license_plate, timestamp, latitude, longitude, image_path, created_at, post_uri, contributor_id, preferred_name, bluesky_handle, phone_number
-                sighting_id = sighting[0]
-                license_plate = sighting[1]
-                timestamp = sighting[2]
-                image_path = sighting[5]
-                # sighting[8] is contributor_id (not used here)
-                preferred_name = sighting[9]
-                bluesky_handle = sighting[10]
-
-                # Format timestamp
-                from datetime import datetime
-
-                dt = datetime.fromisoformat(timestamp)
-                formatted_time = dt.strftime("%B %d, %Y at %I:%M %p")
-
-                click.echo(f"{idx}. ID {sighting_id}: {license_plate}")
-                click.echo(f"   Date: {formatted_time}")
-                click.echo(f"   Image: {Path(image_path).name}")
+                sighting_id = sighting.id
+                license_plate = sighting.license_plate
+                timestamp = sighting.timestamp
+                image_path = sighting.image_path
+                preferred_name = sighting.preferred_name
+                bluesky_handle = sighting.bluesky_handle
+
+                formatted_time = BlueskyClient._format_timestamp(timestamp)
+
+                # Collect each sighting's lines and write them at once
+                lines = [
+                    f"{idx}. ID {sighting_id}: {license_plate}",
+                    f"   Date: {formatted_time}",
+                    f"   Image: {os.path.basename(image_path)}",
+                ]
                 # Display contributor name
                 if preferred_name:
-                    click.echo(f"   Contributor: {preferred_name}")
+                    lines.append(f"   Contributor: {preferred_name}")
                 elif bluesky_handle:
-                    click.echo(f"   Contributor: {bluesky_handle}")
-                click.echo()
+                    lines.append(f"   Contributor: {bluesky_handle}")
+                click.echo("\n".join(lines) + "\n")
 
             click.echo(f"{'='*60}")
             click.echo("Run without --preview to post these sightings")
             click.echo(f"{'='*60}\n")
             return
 
-        for idx, sighting in enumerate(unposted, 1):
-            # Unpack sighting data
-            # Schema: id, license_plate, timestamp, latitude, longitude, image_path, created_at, post_uri, contributor_id, preferred_name, bluesky_handle, phone_number
-            sighting_id = sighting[0]
-            license_plate = sighting[1]
-            timestamp = sighting[2]
-            latitude = sighting[3]
-            longitude = sighting[4]
-            image_path = sighting[5]
-            # sighting[6] is created_at
-            # sighting[7] is post_uri
-            # sighting[8] is contributor_id (not used here)
-            preferred_name = sighting[9]
-            bluesky_handle = sighting[10]
-
-            click.echo(f"\n{'='*60}")
-            click.echo(f"Sighting {idx}/{len(unposted)} (ID: {sighting_id})")
-            click.echo(f"{'='*60}\n")
-
-            # Get counts for post
-            # Use posted count + 1 since this will be the next post for this plate
-            posted_count = db.get_posted_sighting_count(license_plate)
-            sighting_count = posted_count + 1
-
-            # For unique count: get posted unique count, and add 1 if this plate hasn't been posted before
-            unique_posted = db.get_unique_posted_count()
-            if posted_count == 0:
-                # This plate hasn't been posted before, so it's a new unique plate
-                unique_sighted = unique_posted + 1
-            else:
-                # This plate has been posted before, so unique count stays the same
-                unique_sighted = unique_posted
-
-            total_fiskers = db.get_tlc_vehicle_count()
-
-            # Construct contributed_by for post
-            contributed_by = None
-            if preferred_name:
-                contributed_by = preferred_name
-            elif bluesky_handle:
-                contributed_by = bluesky_handle
-
-            # Generate map only if GPS coordinates are available
-            map_path = None
-            if latitude is not None and longitude is not None:
-                map_gen = MapGenerator()
-                map_path = map_gen.generate_sighting_map(
-                    latitude=latitude, longitude=longitude, license_plate=license_plate
-                )
+        # Log in once up front (fails fast on bad credentials) and reuse for every post
+        bluesky = BlueskyClient()
+        map_gen = MapGenerator()
 
-            # Format post preview
-            bluesky = BlueskyClient()
-            post_text = bluesky.format_sighting_text(
-                license_plate=license_plate,
-                sighting_count=sighting_count,
-                timestamp=timestamp,
-                latitude=latitude,
-                longitude=longitude,
-                unique_sighted=unique_sighted,
-                total_fiskers=total_fiskers,
-                contributed_by=contributed_by,
+        # These counts only change when we post, so fetch them once and track them locally
+        total_fiskers = db.get_tlc_vehicle_count()
+        posted_counts = db.get_posted_counts_by_plate()
+        unique_posted = len(posted_counts)
+
+        # Render every map up front, several at a time, while sightings are reviewed.
+        # Neighborhood lookups stay on one background thread to respect Nominatim's rate limit.
+        geocoder = Geocoder()
+        executor = ThreadPoolExecutor(max_workers=4)
+        map_futures = {}
+        neighborhood_futures = {}
+        for s in unposted:
+            if s.latitude is None or s.longitude is None:
+                continue
+            neighborhood_futures[s.id] = geocoder.submit(s.latitude, s.longitude)
+            map_futures[s.id] = executor.submit(
+                map_gen.generate_sighting_map,
+                latitude=s.latitude,
+                longitude=s.longitude,
+                license_plate=s.license_plate,
             )
 
-            click.echo("POST PREVIEW")
-            click.echo("=" * 60)
-            click.echo(post_text)
-            click.echo("\nImages:")
-            click.echo(f"  1. {image_path}")
-            if map_path:
-                click.echo(f"  2. {map_path}")
-            click.echo("=" * 60 + "\n")
+        try:
+            for idx, sighting in enumerate(unposted, 1):
+                # Unpack sighting data
+                sighting_id = sighting.id
+                license_plate = sighting.license_plate
+                timestamp = sighting.timestamp
+                latitude = sighting.latitude
+                longitude = sighting.longitude
+                image_path = sighting.image_path
+                preferred_name = sighting.preferred_name
+                bluesky_handle = sighting.bluesky_handle
+
+                # Map (if GPS is available) was generated in the background, and the
+                # neighborhood is cached once its lookup finishes
+                map_path = None
+                if sighting_id in map_futures:
+                    try:
+                        map_path = map_futures.pop(sighting_id).result()
+                    except Exception as e:
+                        click.echo(f"⚠️  Could not generate map, posting without it: {e}")
+                    neighborhood_futures.pop(sighting_id).result()
+
+                click.echo(f"\n{'='*60}")
+                click.echo(f"Sighting {idx}/{len(unposted)} (ID: {sighting_id})")
+                click.echo(f"{'='*60}\n")
+
+                # Get counts for post
+                # Use posted count + 1 since this will be the next post for this plate
+                posted_count = posted_counts.get(license_plate, 0)
+                sighting_count = posted_count + 1
+
+                # For unique count: use posted unique count, and add 1 if this plate hasn't been posted before
+                if posted_count == 0:
+                    # This plate hasn't been posted before, so it's a new unique plate
+                    unique_sighted = unique_posted + 1
+                else:
+                    # This plate has been posted before, so unique count stays the same
+                    unique_sighted = unique_posted
 
-            # Ask to post with default Yes
-            if click.confirm("Post this to Bluesky?", default=True):
-                click.echo("\nPosting to Bluesky...")
+                # Construct contributed_by for post
+                contributed_by = None
+                if preferred_name:
+                    contributed_by = preferred_name
+                elif bluesky_handle:
+                    contributed_by = bluesky_handle
 
-                try:
-                    # Build images list - include map only if it exists
-                    images = [image_path]
-                    if map_path:
-                        images.append(map_path)
+                # Format post preview
+                post_text = bluesky.format_sighting_text(
+                    license_plate=license_plate,
+                    sighting_count=sighting_count,
+                    timestamp=timestamp,
+                    latitude=latitude,
+                    longitude=longitude,
+                    unique_sighted=unique_sighted,
+                    total_fiskers=total_fiskers,
+                    contributed_by=contributed_by,
+                )
 
-                    response = bluesky.create_sighting_post(
-                        license_plate=license_plate,
-                        sighting_count=sighting_count,
-                        timestamp=timestamp,
-                        latitude=latitude,
-                        longitude=longitude,
-                        images=images,
-                        unique_sighted=unique_sighted,
-                        total_fiskers=total_fiskers,
-                        contributed_by=contributed_by,
-                    )
+                click.echo("POST PREVIEW")
+                click.echo("=" * 60)
+                click.echo(post_text)
+                click.echo("\nImages:")
+                click.echo(f"  1. {image_path}")
+                if map_path:
+                    click.echo(f"  2. {map_path}")
+                click.echo("=" * 60 + "\n")
+
+                # Ask to post with default Yes
+                if click.confirm("Post this to Bluesky?", default=True):
+                    click.echo("\nPosting to Bluesky...")
+
+                    try:
+                        # Build images list - include map only if it exists
+                        images = [image_path]
+                        if map_path:
+                            images.append(map_path)
+
+                        response = bluesky.create_sighting_post(
+                            license_plate=license_plate,
+                            sighting_count=sighting_count,
+                            timestamp=timestamp,
+                            latitude=latitude,
+                            longitude=longitude,
+                            images=images,
+                            unique_sighted=unique_sighted,
+                            total_fiskers=total_fiskers,
+                            contributed_by=contributed_by,
+                        )
 
-                    # Mark as posted
-                    db.mark_as_posted(sighting_id, response.uri)
+                        # Mark as posted
+                        db.mark_as_posted(sighting_id, response.uri)
+                        posted_counts[license_plate] = sighting_count
+                        unique_posted = unique_sighted
 
-                    click.echo("✓ Successfully posted to Bluesky!")
-                    click.echo(f"  - Post URI: {response.uri}\n")
+                        click.echo("✓ Successfully posted to Bluesky!")
+                        click.echo(f"  - Post URI: {response.uri}\n")
 
-                except Exception as e:
-                    click.echo(f"Error posting to Bluesky: {e}", err=True)
-                    if not click.confirm("Continue with next sighting?", default=True):
-                        return
-            else:
-                click.echo("Post skipped\n")
+                    except Exception as e:
+                        click.echo(f"Error posting to Bluesky: {e}", err=True)
+                        if not click.confirm("Continue with next sighting?", default=True):
+                            return
+                else:
+                    click.echo("Post skipped\n")
+        finally:
+            executor.shutdown(cancel_futures=True)
+            geocoder.close(cancel_pending=True)
 
         click.echo(f"\n{'='*60}")
         click.echo("Batch posting complete!")
@@ -874,37 +934,29 @@ def multi_post(batch_size: int = 4, preview: bool = False):
             raise click.Abort()
 
         db = SightingsDatabase()
-        unposted = db.get_unposted_sightings()
+        sightings_to_post = db.get_unposted_sightings(limit=batch_size, distinct_plates=True)
 
-        if not unposted:
+        if not sightings_to_post:
             click.echo("✓ No unposted sightings found!")
             return
 
-        # Limit to batch_size
-        sightings_to_post = unposted[:batch_size]
-
         # Get statistics
         unique_sighted = db.get_unique_sighted_count()
         total_fiskers = db.get_tlc_vehicle_count()
 
         # Extract data for preview
-        # Sighting tuple: (id, license_plate, timestamp, lat, lon, image_path, created_at, post_uri,
-        #                  contributor_id, preferred_name, bluesky_handle, phone_number)
-        plates = [s[1] for s in sightings_to_post]
+        plates = [s.license_plate for s in sightings_to_post]
 
-        # Get unique contributor display names
-        contributor_display_names = set()
-        contributor_ids = set()
+        # Get unique contributor display names, in sighting order. With at most
+        # four sightings a list membership check is cheaper than a set
+        contributor_display_names: list[str] = []
+        contributor_ids: list[int] = []
         for s in sightings_to_post:
-            contributor_id = s[8]  # contributor_id
-            if contributor_id:
-                contributor_ids.add(contributor_id)
-                preferred_name = s[9]  # preferred_name
-                bluesky_handle = s[10]  # bluesky_handle
-                if preferred_name:
-                    contributor_display_names.add(preferred_name)
-                elif bluesky_handle:
-                    contributor_display_names.add(bluesky_handle)
+            if s.contributor_id and s.contributor_id not in contributor_ids:
+                contributor_ids.append(s.contributor_id)
+                display_name = s.preferred_name or s.bluesky_handle
+                if display_name and display_name not in contributor_display_names:
+                    contributor_display_names.append(display_name)
 
         # Show preview
         click.echo(f"\n{'='*60}")
@@ -929,7 +981,7 @@ def multi_post(batch_size: int = 4, preview: bool = False):
 
         # Show contributors
         if contributor_display_names:
-            click.echo(f"🙏 Thanks to: {', '.join(sorted(contributor_display_names))}\n")
+            click.echo(f"🙏 Thanks to: {', '.join(contributor_display_names)}\n")
         elif contributor_ids:
             # Contributors exist but haven't set names
             click.echo(f"🙏 Thanks to: {len(contributor_ids)} anonymous contributor(s)\n")
@@ -937,9 +989,7 @@ def multi_post(batch_size: int = 4, preview: bool = False):
         # Show images
         click.echo("📸 Images:")
         for idx, sighting in enumerate(sightings_to_post, 1):
-            image_path = sighting[5]
-            plate = sighting[1]
-            click.echo(f"   {idx}. {Path(image_path).name} ({plate})")
+            click.echo(f"   {idx}. {sighting.image_basename} ({sighting.license_plate})")
 
         click.echo(f"\n{'='*60}\n")
 
@@ -961,7 +1011,7 @@ def multi_post(batch_size: int = 4, preview: bool = False):
         )
 
         # Mark all sightings as posted
-        sighting_ids = [s[0] for s in sightings_to_post]
+        sighting_ids = [s.id for s in sightings_to_post]
         post_uri = response.uri
         db.mark_batch_as_posted(sighting_ids, post_uri)
 
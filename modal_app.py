@@ -23,6 +23,7 @@ image = (
         "fastapi>=0.115.0",
         "twilio>=9.0.0",
         "imagehash>=4.3.1",
+        "numpy>=1.26.0",
     )
     .add_local_python_source("database")
     .add_local_python_source("validate")
@@ -49,7 +50,59 @@ volume = modal.Volume.from_name("oceans-of-nyc", create_if_missing=True)
 VOLUME_PATH = "/data"
 IMAGES_PATH = f"{VOLUME_PATH}/images"
 MAPS_PATH = f"{VOLUME_PATH}/maps"
+# Persistent reverse geocoding cache, so repeat locations skip Nominatim across runs
+GEOCODE_CACHE_PATH = f"{VOLUME_PATH}/geocode"
 TLC_PATH = f"{VOLUME_PATH}/tlc"
+# Saved Bluesky login session, so scheduled runs skip the password login
+BLUESKY_SESSION_PATH = f"{VOLUME_PATH}/bluesky_session.txt"
+
+# How long an idle container stays warm. A warm container keeps its database
+# connections (database/connection.py), so back-to-back SMS messages and the
+# queue's chained batch calls skip the connect handshake.
+WARM_CONTAINER_SECONDS = 300
+
+# Set once this container has created the image and map directories
+_volume_dirs_ready = False
+
+
+def _ensure_volume_dirs():
+    """Create the volume's image and map directories, once per container."""
+    global _volume_dirs_ready
+    if _volume_dirs_ready:
+        return
+
+    import os
+
+    os.makedirs(IMAGES_PATH, exist_ok=True)
+    os.makedirs(MAPS_PATH, exist_ok=True)
+    _volume_dirs_ready = True
+
+
+@app.function(
+    image=image,
+    volumes={VOLUME_PATH: volume},
+)
+def make_map(sighting_id: int, latitude: float, longitude: float) -> str:
+    """
+    Render a sighting's map into the volume.
+
+    Args:
+        sighting_id: The sighting ID, used for the map filename
+        latitude: GPS latitude
+        longitude: GPS longitude
+
+    Returns:
+        Path to the map in the volume
+    """
+    from geolocate import generate_map
+
+    _ensure_volume_dirs()
+
+    map_path = f"{MAPS_PATH}/map_{sighting_id}.png"
+    generate_map(latitude, longitude, map_path)
+    volume.commit()
+
+    return map_path
 
 
 @app.function(
@@ -68,76 +121,103 @@ def post_single_sighting(limit: int = 5, dry_run: bool = False):
     """
     import os
     import time
-    from datetime import datetime
-    from pathlib import Path
+    import traceback
 
     from database import SightingsDatabase
-    from geolocate import generate_map, reverse_geocode
+    from geolocate import Geocoder
     from post.bluesky import BlueskyClient
 
     print(f"🚀 Starting batch post (limit: {limit}, dry_run: {dry_run})")
 
     # Ensure directories exist
-    os.makedirs(IMAGES_PATH, exist_ok=True)
-    os.makedirs(MAPS_PATH, exist_ok=True)
+    _ensure_volume_dirs()
 
     # Initialize database and client
     db = SightingsDatabase()
-    client = BlueskyClient()
+    client = BlueskyClient(session_path=BLUESKY_SESSION_PATH)
 
-    # Get unposted sightings
-    sightings = db.get_unposted_sightings()
+    # Only fetch the sightings this run will post; count the rest only if some were left out
+    sightings_to_post = db.get_unposted_sightings(limit=limit or None)
 
-    if not sightings:
+    if not sightings_to_post:
         print("✓ No unposted sightings found")
         return {"posted": 0, "message": "No unposted sightings"}
 
-    print(f"Found {len(sightings)} unposted sighting(s)")
+    total_unposted = len(sightings_to_post)
+    if limit and total_unposted == limit:
+        total_unposted = db.get_unposted_count()
+
+    print(f"Found {total_unposted} unposted sighting(s)")
 
-    # Limit the number of posts
-    sightings_to_post = sightings[:limit] if limit else sightings
     posted_count = 0
 
+    # These only change when we post, so fetch them once and track them locally
+    total_vehicles = db.get_tlc_vehicle_count()
+    posted_counts = db.get_posted_counts_by_plate()
+    unique_posted_count = len(posted_counts)
+
+    ordinal = BlueskyClient._get_ordinal
+
+    # List the volume's images and maps once rather than stat each file in the loop
+    volume_images = set(os.listdir(IMAGES_PATH))
+    volume_maps = set(os.listdir(MAPS_PATH))
+
+    # Maps are independent, so render the missing ones in parallel containers before
+    # posting, then reload the volume once to see them
+    maps_to_make = [
+        (s.id, s.latitude, s.longitude)
+        for s in sightings_to_post
+        if s.latitude and s.longitude and f"map_{s.id}.png" not in volume_maps
+    ]
+    if maps_to_make:
+        print(f"🗺 Generating {len(maps_to_make)} map(s)...")
+        results = make_map.starmap(maps_to_make, return_exceptions=True)
+        for (sighting_id, _, _), result in zip(maps_to_make, results, strict=True):
+            if isinstance(result, Exception):
+                print(f"⚠ Could not generate map for sighting {sighting_id}: {result}")
+            else:
+                volume_maps.add(f"map_{sighting_id}.png")
+        volume.reload()
+
+    # Look up every neighborhood on the geocoder's background thread; its rate limiter
+    # keeps Nominatim at one request per second. Locations already in the volume's
+    # cache don't hit Nominatim at all. Started only after the reload above, since
+    # Modal can't reload the volume while the thread has the SQLite cache open.
+    geocoder = Geocoder(cache_dir=GEOCODE_CACHE_PATH)
+    neighborhood_futures = {
+        s.id: geocoder.submit(s.latitude, s.longitude)
+        for s in sightings_to_post
+        if s.latitude and s.longitude
+    }
+
     for idx, sighting in enumerate(sightings_to_post, 1):
-        (
-            sighting_id,
-            license_plate,
-            timestamp,
-            latitude,
-            longitude,
-            image_path,
-            created_at,
-            posted,
-            post_uri,
-            contributed_by,
-        ) = sighting
+        sighting_id = sighting.id
+        license_plate = sighting.license_plate
+        timestamp = sighting.timestamp
+        latitude = sighting.latitude
+        longitude = sighting.longitude
+        image_path = sighting.image_path
+        contributed_by = sighting.preferred_name or sighting.bluesky_handle
 
         print(f"\n{'='*60}")
         print(f"Processing sighting {idx}/{len(sightings_to_post)} (ID: {sighting_id})")
         print(f"{'='*60}")
 
         try:
-            # Get sighting counts
-            posted_count_for_plate = db.get_posted_sighting_count(license_plate)
-            unique_posted_count = db.get_unique_posted_count()
-            total_vehicles = db.get_tlc_vehicle_count()
+            posted_count_for_plate = posted_counts.get(license_plate, 0)
 
             # Get neighborhood name
             neighborhood = "Unknown location"
-            if latitude and longitude:
+            if sighting_id in neighborhood_futures:
                 try:
-                    neighborhood = reverse_geocode(latitude, longitude)
-                    time.sleep(1.1)  # Respect Nominatim rate limit
+                    neighborhood = neighborhood_futures[sighting_id].result() or neighborhood
                 except Exception as e:
                     print(f"⚠ Warning: Could not reverse geocode: {e}")
 
             # Format timestamp
-            dt = datetime.fromisoformat(timestamp)
-            formatted_date = dt.strftime("%B %d, %Y at %I:%M %p")
+            formatted_date = BlueskyClient._format_timestamp(timestamp)
 
             # Build post text
-            ordinal = lambda n: f"{n}{'th' if 11<=n<=13 else {1:'st',2:'nd',3:'rd'}.get(n%10,'th')}"
-
             post_text = f"""🌊 Fisker Ocean sighting!
 
 🚗 Plate: {license_plate}
@@ -158,10 +238,10 @@ def post_single_sighting(limit: int = 5, dry_run: bool = False):
             # Check if sighting image exists in volume
             if image_path:
                 # Convert local path to volume path
-                image_filename = Path(image_path).name
+                image_filename = sighting.image_basename
                 volume_image_path = f"{IMAGES_PATH}/{image_filename}"
 
-                if os.path.exists(volume_image_path):
+                if image_filename in volume_images:
                     images_to_post.append(volume_image_path)
                     image_alts.append(
                         f"Fisker Ocean with plate {license_plate} spotted in {neighborhood}"
@@ -170,22 +250,12 @@ def post_single_sighting(limit: int = 5, dry_run: bool = False):
                 else:
                     print(f"⚠ Image not found in volume: {image_filename}")
 
-            # Generate map if we have coordinates
+            # Add the map generated before the loop, if we have coordinates
             if latitude and longitude:
                 map_filename = f"map_{sighting_id}.png"
-                map_path = f"{MAPS_PATH}/{map_filename}"
 
-                if not os.path.exists(map_path):
-                    try:
-                        print("🗺 Generating map...")
-                        generate_map(latitude, longitude, map_path)
-                        volume.commit()  # Persist the map to volume
-                        print(f"✓ Map generated: {map_filename}")
-                    except Exception as e:
-                        print(f"⚠ Could not generate map: {e}")
-
-                if os.path.exists(map_path):
-                    images_to_post.append(map_path)
+                if map_filename in volume_maps:
+                    images_to_post.append(f"{MAPS_PATH}/{map_filename}")
                     image_alts.append(
                         f"Map showing location of Fisker Ocean sighting in {neighborhood}"
                     )
@@ -207,8 +277,12 @@ def post_single_sighting(limit: int = 5, dry_run: bool = False):
 
                 post_uri_result = response.uri
 
-                # Mark as posted
+                # Mark right away, so a timeout or crash later in the run can't lead
+                # the next run to post this sighting again
                 db.mark_as_posted(sighting_id, post_uri_result)
+                if license_plate not in posted_counts:
+                    unique_posted_count += 1
+                posted_counts[license_plate] = posted_count_for_plate + 1
 
                 print(f"✓ Posted to Bluesky: {post_uri_result}")
                 posted_count += 1
@@ -220,23 +294,30 @@ def post_single_sighting(limit: int = 5, dry_run: bool = False):
 
         except Exception as e:
             print(f"✗ Error posting sighting {sighting_id}: {e}")
-            import traceback
-
             traceback.print_exc()
             continue
 
+    geocoder.close(cancel_pending=True)
+    # Persist new geocode cache entries once for the whole batch
+    volume.commit()
+
     print(f"\n{'='*60}")
     print(f"✓ Batch complete: {posted_count} sighting(s) posted")
     print(f"{'='*60}")
 
     return {
         "posted": posted_count,
-        "total_unposted": len(sightings),
+        "total_unposted": total_unposted,
         "message": f"Posted {posted_count} sightings",
     }
 
 
-@app.function(image=image, secrets=secrets, volumes={VOLUME_PATH: volume})
+@app.function(
+    image=image,
+    secrets=secrets,
+    volumes={VOLUME_PATH: volume},
+    scaledown_window=WARM_CONTAINER_SECONDS,
+)
 def post_multiple_sightings(batch_size: int = 4, dry_run: bool = False):
     """
     Post multiple sightings in a single batch post.
@@ -245,41 +326,45 @@ def post_multiple_sightings(batch_size: int = 4, dry_run: bool = False):
         batch_size: Number of sightings to include (max 4)
         dry_run: If True, only show what would be posted without actually posting
     """
-    import os
-
     from database import SightingsDatabase
     from post.bluesky import BlueskyClient
 
     print(f"🚀 Starting multi-post (batch_size: {batch_size}, dry_run: {dry_run})")
 
     # Ensure directories exist
-    os.makedirs(IMAGES_PATH, exist_ok=True)
+    _ensure_volume_dirs()
 
     # Initialize database and client
     db = SightingsDatabase()
 
-    # Get unposted sightings
-    sightings = db.get_unposted_sightings()
-
-    if not sightings:
-        print("✓ No unposted sightings found")
-        return {"posted": 0, "message": "No unposted sightings"}
-
     # Limit to batch_size
     if batch_size < 1 or batch_size > 4:
         batch_size = 4
 
-    sightings_to_post = sightings[:batch_size]
+    # Get the oldest unposted sightings, one per plate so each image slot shows a
+    # different vehicle
+    sightings_to_post = db.get_unposted_sightings(limit=batch_size, distinct_plates=True)
 
-    print(f"Found {len(sightings)} unposted sighting(s), posting {len(sightings_to_post)} in batch")
+    if not sightings_to_post:
+        print("✓ No unposted sightings found")
+        return {"posted": 0, "message": "No unposted sightings"}
+
+    print(
+        f"Found {db.get_unposted_count()} unposted sighting(s), "
+        f"posting {len(sightings_to_post)} in batch"
+    )
 
     # Get statistics
     unique_sighted = db.get_unique_sighted_count()
     total_fiskers = db.get_tlc_vehicle_count()
 
     # Extract info for logging
-    plates = [s[1] for s in sightings_to_post]
-    contributors = set(s[9] for s in sightings_to_post if s[9])
+    plates = []
+    contributors = set()
+    for s in sightings_to_post:
+        plates.append(s.license_plate)
+        if s.preferred_name:
+            contributors.add(s.preferred_name)
 
     print("\n📊 Batch Post Info:")
     print(f"   Plates: {', '.join(plates)}")
@@ -297,15 +382,17 @@ def post_multiple_sightings(batch_size: int = 4, dry_run: bool = False):
 
     try:
         # Post to Bluesky
-        client = BlueskyClient()
+        client = BlueskyClient(session_path=BLUESKY_SESSION_PATH)
         response = client.create_batch_sighting_post(
             sightings=sightings_to_post, unique_sighted=unique_sighted, total_fiskers=total_fiskers
         )
 
         # Mark all sightings as posted
-        sighting_ids = [s[0] for s in sightings_to_post]
+        sighting_ids = [s.id for s in sightings_to_post]
         post_uri = response.uri
         db.mark_batch_as_posted(sighting_ids, post_uri)
+        # Persist the Bluesky session if it was created or refreshed
+        volume.commit()
 
         print("\n✓ Batch posted successfully!")
         print(f"  Post URI: {post_uri}")
@@ -332,41 +419,46 @@ def post_multiple_sightings(batch_size: int = 4, dry_run: bool = False):
     secrets=secrets,
     volumes={VOLUME_PATH: volume},
     schedule=modal.Cron("0 22 * * *"),  # Run daily at 6 PM ET (10 PM UTC)
+    scaledown_window=WARM_CONTAINER_SECONDS,
+    timeout=1800,  # Works through the whole queue in one container
 )
 def post_sightings_queue():
     """
     Scheduled function that runs daily at 6 PM ET.
-    Recursively processes all unposted sightings:
+    Processes all unposted sightings:
     - If 1 sighting: uses single-sighting format with full details
     - If 2-4 sightings: uses batch format
-    - If 5+ sightings: posts first 4 in batch, then recursively processes remainder
+    - If 5+ sightings: posts batches of 4 until at most one is left, then posts that one
+      in single-sighting format
     - If no sightings: exits gracefully
     """
     import os
+    import time
+    import traceback
     from datetime import datetime
-    from pathlib import Path
 
     from database import SightingsDatabase
-    from geolocate import generate_map
-    from post.bluesky import BlueskyClient
 
     print(f"⏰ Scheduled sightings queue post triggered at {datetime.now()}")
 
     # Check how many unposted sightings we have
     db = SightingsDatabase()
-    sightings = db.get_unposted_sightings()
+    num_sightings = db.get_unposted_count()
 
-    if not sightings:
+    if not num_sightings:
         print("✓ No unposted sightings found")
         return {"posted": 0, "message": "No unposted sightings"}
 
-    num_sightings = len(sightings)
     print(f"Found {num_sightings} unposted sighting(s)")
 
     if num_sightings == 1:
+        # Only this path builds posts here; batches are handled by post_multiple_sightings
+        from geolocate import Geocoder, generate_map
+        from post.bluesky import BlueskyClient
+
         # Use single-sighting format for one sighting
         print("Using single-sighting format")
-        sighting = sightings[0]
+        sighting = db.get_unposted_sightings(limit=1)[0]
         (
             sighting_id,
             license_plate,
@@ -380,12 +472,12 @@ def post_sightings_queue():
             preferred_name,
             bluesky_handle,
             phone_number,
+            image_basename,
         ) = sighting
 
         try:
             # Ensure directories exist
-            os.makedirs(IMAGES_PATH, exist_ok=True)
-            os.makedirs(MAPS_PATH, exist_ok=True)
+            _ensure_volume_dirs()
 
             # Get statistics
             sighting_count = db.get_sighting_count(license_plate)
@@ -404,7 +496,7 @@ def post_sightings_queue():
 
             # Prepare images
             images = []
-            image_filename = Path(image_path).name if image_path else None
+            image_filename = image_basename
             volume_image_path = f"{IMAGES_PATH}/{image_filename}" if image_filename else None
 
             if volume_image_path and os.path.exists(volume_image_path):
@@ -430,8 +522,12 @@ def post_sightings_queue():
                 if os.path.exists(map_path):
                     images.append(map_path)
 
-            # Post to Bluesky using single-sighting format
-            client = BlueskyClient()
+            # Post to Bluesky using single-sighting format, geocoding through the
+            # volume's cache
+            client = BlueskyClient(
+                geocoder=Geocoder(cache_dir=GEOCODE_CACHE_PATH),
+                session_path=BLUESKY_SESSION_PATH,
+            )
             response = client.create_sighting_post(
                 license_plate=license_plate,
                 sighting_count=sighting_count,
@@ -446,6 +542,7 @@ def post_sightings_queue():
 
             # Mark as posted
             db.mark_as_posted(sighting_id, response.uri)
+            volume.commit()
 
             result = {
                 "posted": 1,
@@ -458,34 +555,43 @@ def post_sightings_queue():
 
         except Exception as e:
             print(f"✗ Error posting sighting: {e}")
-            import traceback
-
             traceback.print_exc()
             return {"posted": 0, "error": str(e), "message": f"Failed to post: {e}"}
 
     else:
-        # Use batch format for multiple sightings (2+)
-        print(f"Using batch format for {min(num_sightings, 4)} sightings")
-        result = post_multiple_sightings.remote(batch_size=4, dry_run=False)
-        print(f"✓ Posted batch: {result}")
-
-        # If there are more than 4 sightings, recursively process the remainder
-        if num_sightings > 4:
-            print(f"\n🔄 {num_sightings - 4} sightings remaining, processing next batch...")
-            import time
-
-            time.sleep(2)  # Brief pause between batches
-            next_result = post_sightings_queue.remote()
-
-            # Combine results
-            total_posted = result.get("posted", 0) + next_result.get("posted", 0)
-            return {
-                "posted": total_posted,
-                "batches": 2,
-                "message": f"Posted {total_posted} sightings across multiple batches",
-            }
+        # Use batch format for multiple sightings (2+). Batches run in this container
+        # with .local(); a .remote() call per batch would start a new container each time.
+        total_posted = 0
+        batches = 0
+        while num_sightings > 1:
+            print(f"Using batch format for {min(num_sightings, 4)} sightings")
+            result = post_multiple_sightings.local(batch_size=4, dry_run=False)
+            print(f"✓ Posted batch: {result}")
+
+            batches += 1
+            total_posted += result.get("posted", 0)
+            if not result.get("posted"):
+                # Don't retry a failing batch in a loop
+                break
+
+            num_sightings = db.get_unposted_count()
+            if num_sightings:
+                print(f"\n🔄 {num_sightings} sightings remaining, processing next batch...")
+                time.sleep(2)  # Brief pause between batches
+
+        # A single leftover sighting gets the single-sighting format
+        if num_sightings == 1:
+            batches += 1
+            total_posted += post_sightings_queue.local().get("posted", 0)
+
+        if batches == 1:
+            return result
 
-        return result
+        return {
+            "posted": total_posted,
+            "batches": batches,
+            "message": f"Posted {total_posted} sightings across multiple batches",
+        }
 
 
 @app.function(
@@ -498,13 +604,7 @@ def get_stats():
 
     db = SightingsDatabase()
 
-    stats = {
-        "total_sightings": len(db.get_all_sightings()),
-        "unique_posted": db.get_unique_posted_count(),
-        "unique_sighted": db.get_unique_sighted_count(),
-        "total_vehicles": db.get_tlc_vehicle_count(),
-        "unposted": len(db.get_unposted_sightings()),
-    }
+    stats = db.get_all_stats()
 
     print("\n📊 Database Statistics:")
     print(f"   Total sightings: {stats['total_sightings']}")
@@ -549,32 +649,75 @@ def get_hello():
     return {"status": "success"}
 
 
-@app.function(
-    image=image,
-    volumes={VOLUME_PATH: volume},
-)
-def upload_image(filename: str, image_data: bytes):
+def _write_image(filename: str, image_data: bytes) -> dict:
     """
-    Upload an image to the Modal volume.
+    Write an image to the volume's images directory without committing.
+
+    Skips the write when the volume already has the same bytes, as recorded in a
+    .sha file next to the image.
 
     Args:
         filename: Name for the image file
         image_data: Raw image bytes
+
+    Returns:
+        dict with filename, size_kb, path and skipped
     """
+    import hashlib
     import os
 
-    os.makedirs(IMAGES_PATH, exist_ok=True)
+    from post.bluesky import BlueskyClient
 
     file_path = f"{IMAGES_PATH}/{filename}"
+    digest_path = f"{file_path}.sha"
+    size = len(image_data) / 1024
+
+    digest = hashlib.blake2b(image_data, digest_size=16).hexdigest()
+    try:
+        with open(digest_path) as f:
+            unchanged = f.read().strip() == digest and os.path.exists(file_path)
+    except FileNotFoundError:
+        unchanged = False
+
+    if unchanged:
+        print(f"= Unchanged {filename} ({size:.1f} KB)")
+        return {"filename": filename, "size_kb": size, "path": file_path, "skipped": True}
+
     with open(file_path, "wb") as f:
         f.write(image_data)
+    with open(digest_path, "w") as f:
+        f.write(digest)
 
-    volume.commit()
+    # Encode the Bluesky upload now so posting only reads it
+    try:
+        BlueskyClient.write_precompressed(file_path)
+    except Exception as e:
+        print(f"⚠ Could not precompress {filename}: {e}")
 
-    size = len(image_data) / 1024
     print(f"✓ Uploaded {filename} ({size:.1f} KB)")
 
-    return {"filename": filename, "size_kb": size, "path": file_path}
+    return {"filename": filename, "size_kb": size, "path": file_path, "skipped": False}
+
+
+@app.function(
+    image=image,
+    volumes={VOLUME_PATH: volume},
+)
+def upload_image(filename: str, image_data: bytes):
+    """
+    Upload an image to the Modal volume.
+
+    Args:
+        filename: Name for the image file
+        image_data: Raw image bytes
+    """
+    _ensure_volume_dirs()
+
+    result = _write_image(filename, image_data)
+    if not result["skipped"]:
+        volume.commit()
+
+    return result
 
 
 # ==================== Twilio SMS/MMS Webhook ====================
@@ -587,6 +730,7 @@ def upload_image(filename: str, image_data: bytes):
         modal.Secret.from_name("twilio-credentials"),
     ],
     volumes={VOLUME_PATH: volume},
+    scaledown_window=WARM_CONTAINER_SECONDS,
 )
 @modal.asgi_app()
 def chat_sms_webhook():
@@ -603,7 +747,7 @@ def chat_sms_webhook():
     - MediaUrl0, MediaUrl1, etc.: URLs to media files
     - MediaContentType0, etc.: MIME types of media
     """
-    from fastapi import FastAPI, Request
+    from fastapi import BackgroundTasks, FastAPI, Request
     from fastapi.responses import Response
 
     from chat.webhook import handle_incoming_sms, parse_twilio_request
@@ -611,7 +755,7 @@ def chat_sms_webhook():
     web_app = FastAPI()
 
     @web_app.post("/")
-    async def handle_sms(request: Request):
+    async def handle_sms(request: Request, background_tasks: BackgroundTasks):
         print("📨 Received webhook request")
 
         # Get the raw body from the request
@@ -649,8 +793,10 @@ def chat_sms_webhook():
             channel_type=channel_type,
         )
 
-        # Commit volume changes if any images were saved
-        volume.commit()
+        # Commit saved images after the reply goes out, so Twilio isn't kept waiting
+        # on the volume flush. Text-only messages don't write to the volume.
+        if num_media:
+            background_tasks.add_task(volume.commit)
 
         # Return TwiML response
         return Response(
@@ -701,6 +847,10 @@ def update_tlc_vehicles():
         # Download, import, and filter
         result = tlc_db.update_from_nyc_open_data(output_dir=TLC_PATH)
 
+        if result["unchanged"]:
+            print("✓ TLC data unchanged since last update, skipped import")
+            return result
+
         # Commit volume changes to persist CSVs
         volume.commit()
 
@@ -883,7 +1033,10 @@ def main(
         modal run modal_app.py --command=update-tlc
         modal run modal_app.py --command=backfill-hashes --dry-run=true
     """
+    import hashlib
+    import io
     import os
+    from concurrent.futures import ThreadPoolExecutor
     from pathlib import Path
 
     if command == "test":
@@ -912,20 +1065,58 @@ def main(
             print("✗ Error: Local sightings directory not found")
             return
 
-        image_files = (
-            list(local_images_dir.glob("*.jpg"))
-            + list(local_images_dir.glob("*.jpeg"))
-            + list(local_images_dir.glob("*.png"))
-        )
+        # One directory read instead of a glob pass per extension
+        with os.scandir(local_images_dir) as entries:
+            image_files = [
+                Path(entry.path)
+                for entry in entries
+                if entry.name.endswith((".jpg", ".jpeg", ".png")) and entry.is_file()
+            ]
         print(f"Found {len(image_files)} images to sync")
 
-        for img_path in image_files:
-            print(f"Uploading {img_path.name}...")
-            with open(img_path, "rb") as f:
-                image_data = f.read()
-            upload_image.remote(img_path.name, image_data)
+        # Skip files whose digest matches the .sha stored next to the volume copy. Sizes
+        # alone would miss an edited image that happens to keep the same byte count.
+        try:
+            remote_names = {entry.path.rsplit("/", 1)[-1] for entry in volume.listdir("images")}
+        except modal.exception.NotFoundError:
+            remote_names = set()
+
+        def remote_digest(name: str) -> str | None:
+            """Read the volume's .sha for an image, or None if either file is missing."""
+            if name not in remote_names or f"{name}.sha" not in remote_names:
+                return None
+            try:
+                return b"".join(volume.read_file(f"images/{name}.sha")).decode().strip()
+            except modal.exception.NotFoundError:
+                return None
+
+        digests = {
+            p: hashlib.blake2b(p.read_bytes(), digest_size=16).hexdigest() for p in image_files
+        }
+        # One small read per image, so fetch the stored digests concurrently
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            stored = executor.map(remote_digest, [p.name for p in image_files])
+            to_upload = [
+                p for p, digest in zip(image_files, stored, strict=True) if digest != digests[p]
+            ]
+
+        # Upload straight to the volume in one parallel batch and commit, instead of
+        # passing every image's bytes through a function call. Each image's .sha is
+        # written too, so upload_image's unchanged-file check stays accurate.
+        if to_upload:
+            with volume.batch_upload(force=True) as batch:
+                for img_path in to_upload:
+                    print(f"Uploading {img_path.name}...")
+                    batch.put_file(img_path, f"images/{img_path.name}")
+                    batch.put_file(
+                        io.BytesIO(digests[img_path].encode()), f"images/{img_path.name}.sha"
+                    )
 
-        print(f"\n✓ Synced {len(image_files)} images to Modal volume")
+        skipped = len(image_files) - len(to_upload)
+        print(
+            f"\n✓ Synced {len(image_files)} images to Modal volume "
+            f"({len(to_upload)} uploaded, {skipped} unchanged)"
+        )
     elif command == "update-tlc":
         print("🔄 Updating TLC vehicle data...")
         update_tlc_vehicles.remote()
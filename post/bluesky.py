@@ -1,23 +1,76 @@
 """Bluesky client for posting sightings."""
 
+import functools
+import hashlib
 import io
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 from atproto import Client, client_utils, models
-from PIL import Image
+from PIL import Image, ImageOps
 
 from geolocate.geocoding import Geocoder
 
+# Images are compressed below this size to fit Bluesky's 976 KB blob limit
+MAX_IMAGE_KB = 950
+
+# Longest side of an uploaded image. The Bluesky app downsizes to this anyway.
+MAX_IMAGE_DIMENSION = 2000
+
+# Small images with at most this many colors (maps, screenshots) are uploaded as PNG,
+# which stores flat color exactly and usually smaller than JPEG
+FLAT_IMAGE_MAX_COLORS = 256
+FLAT_IMAGE_MAX_PIXELS = 500_000
+
+# Suffix of an image's ready-to-upload JPEG, written ahead of time by
+# BlueskyClient.write_precompressed so posting only has to read it
+PRECOMPRESSED_SUFFIX = ".bsky.jpg"
+
+# Every progress bar at the default length, indexed by filled block count
+PROGRESS_BAR_LENGTH = 10
+_PROGRESS_BARS = tuple(
+    "█" * filled + "▒" * (PROGRESS_BAR_LENGTH - filled) for filled in range(PROGRESS_BAR_LENGTH + 1)
+)
+
+# Month names for post timestamps, so formatting doesn't depend on the locale
+_MONTH_NAMES = (
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
+
+# Ordinal suffix by last digit (11th-13th are special-cased)
+_ORDINAL_SUFFIXES = ("th", "st", "nd", "rd", "th", "th", "th", "th", "th", "th")
+
 
 class BlueskyClient:
-    def __init__(self, handle: str | None = None, password: str | None = None):
+    def __init__(
+        self,
+        handle: str | None = None,
+        password: str | None = None,
+        geocoder: Geocoder | None = None,
+        session_path: str | None = None,
+    ):
         """
         Initialize Bluesky client with credentials.
 
         Args:
             handle: Bluesky handle (e.g., user.bsky.social). If not provided, reads from BLUESKY_HANDLE env var.
             password: Bluesky app password. If not provided, reads from BLUESKY_PASSWORD env var.
+            geocoder: Geocoder for location text (optional, e.g. one with a persistent cache).
+                A default Geocoder is created on first use if not provided.
+            session_path: File to save the login session to (optional). When it holds a
+                still-valid session, that is resumed instead of logging in with the password.
         """
         self.handle = handle or os.getenv("BLUESKY_HANDLE")
         self.password = password or os.getenv("BLUESKY_PASSWORD")
@@ -30,16 +83,56 @@ class BlueskyClient:
             )
 
         self.client = Client()
+        self._geocoder = geocoder
+        # SHA-256 of an image file -> its uploaded blob, so repeat uploads are skipped
+        self._blob_cache: dict[str, models.BlobRef] = {}
+        # Lowercased handle -> DID, so recurring contributors are resolved once
+        self._did_cache: dict[str, str] = {}
+        self.session_path = session_path
+        if session_path:
+            # Token refreshes during a run replace the saved session too
+            self.client.on_session_change(lambda _event, _session: self._save_session())
         self.login()
 
     def login(self):
-        """Authenticate with Bluesky."""
+        """Authenticate with Bluesky, resuming the saved session if there is one."""
+        if self.session_path and os.path.exists(self.session_path):
+            try:
+                with open(self.session_path) as f:
+                    self.client.login(session_string=f.read().strip())
+                return
+            except Exception as e:
+                print(f"⚠ Saved Bluesky session not usable, logging in again: {e}")
+
         self.client.login(self.handle, self.password)
+        self._save_session()
+
+    def _save_session(self):
+        """Write the current session to session_path, if set."""
+        if not self.session_path:
+            return
+
+        os.makedirs(os.path.dirname(self.session_path) or ".", exist_ok=True)
+        tmp_path = f"{self.session_path}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(self.client.export_session_string())
+        os.replace(tmp_path, self.session_path)
+
+    @property
+    def geocoder(self) -> Geocoder:
+        """Geocoder shared by every post this client builds, so they reuse one HTTP session."""
+        if self._geocoder is None:
+            self._geocoder = Geocoder()
+        return self._geocoder
 
-    def compress_image(self, image_path: str, max_size_kb: int = 950) -> bytes:
+    @staticmethod
+    def compress_image(image_path: str, max_size_kb: int = MAX_IMAGE_KB) -> bytes:
         """
         Compress an image to fit within Bluesky's size limit.
 
+        Uses the image's precompressed copy (see write_precompressed) instead when
+        one exists and is newer than the image.
+
         Args:
             image_path: Path to the image file
             max_size_kb: Maximum size in KB (default 950KB, under the 976KB limit)
@@ -47,7 +140,47 @@ class BlueskyClient:
         Returns:
             Compressed image data as bytes
         """
+        if max_size_kb == MAX_IMAGE_KB:
+            precompressed_path = f"{image_path}{PRECOMPRESSED_SUFFIX}"
+            try:
+                if os.path.getmtime(precompressed_path) >= os.path.getmtime(image_path):
+                    with open(precompressed_path, "rb") as f:
+                        return f.read()
+            except OSError:
+                pass
+
+        return BlueskyClient._encode_jpeg(image_path, max_size_kb)
+
+    @staticmethod
+    def _encode_jpeg(image_path: str, max_size_kb: int) -> bytes:
+        """
+        Encode an image of at most max_size_kb for upload.
+
+        Flat-color images become PNG; everything else becomes a JPEG, lowering
+        quality then size until it fits.
+        """
         img = Image.open(image_path)
+        max_size_bytes = max_size_kb * 1024
+
+        # A JPEG that's already small enough is uploaded as is. Opening only read the
+        # headers, so this skips the decode and encode entirely. Files with EXIF are
+        # still re-encoded, which strips the phone's GPS and device metadata.
+        if (
+            img.format == "JPEG"
+            and img.mode == "RGB"
+            and "exif" not in img.info
+            and max(img.size) <= MAX_IMAGE_DIMENSION
+            and os.path.getsize(image_path) <= max_size_bytes
+        ):
+            with open(image_path, "rb") as f:
+                return f.read()
+
+        # Let libjpeg decode phone photos at 1/2-1/8 scale via DCT scaling, then fit
+        # the rest of the way with a proper resample
+        img.draft("RGB", (MAX_IMAGE_DIMENSION, MAX_IMAGE_DIMENSION))
+        # Bake in the camera's rotation, since the EXIF that records it isn't kept
+        img = ImageOps.exif_transpose(img)
+        img.thumbnail((MAX_IMAGE_DIMENSION, MAX_IMAGE_DIMENSION), Image.Resampling.LANCZOS)
 
         # Convert RGBA to RGB if necessary
         if img.mode == "RGBA":
@@ -57,48 +190,119 @@ class BlueskyClient:
         elif img.mode != "RGB":
             img = img.convert("RGB")
 
-        # Start with quality 85 and reduce if needed
-        quality = 85
-        max_size_bytes = max_size_kb * 1024
+        # Color profiles can run to tens of KB, which is better spent on quality
+        img.info.pop("icc_profile", None)
 
-        while quality > 20:
+        # getcolors() gives up (returns None) past maxcolors, so this stays cheap for photos
+        if (
+            img.width * img.height <= FLAT_IMAGE_MAX_PIXELS
+            and img.getcolors(maxcolors=FLAT_IMAGE_MAX_COLORS) is not None
+        ):
             buffer = io.BytesIO()
-            img.save(buffer, format="JPEG", quality=quality, optimize=True)
-            size = buffer.tell()
-
-            if size <= max_size_bytes:
-                buffer.seek(0)
-                return buffer.read()
+            img.save(buffer, format="PNG", optimize=True)
+            if buffer.tell() <= max_size_bytes:
+                return buffer.getvalue()
+
+        # Most photos fit at quality 85 on the first try
+        data = BlueskyClient._save_jpeg(img, 85)
+        if len(data) <= max_size_bytes:
+            return data
+
+        # Otherwise predict the quality that just fits from how far over the first
+        # encode was (size shrinks a bit less than proportionally with quality)
+        best = None
+        low, high = 20, 84
+        quality = min(high, max(low, int(85 * (max_size_bytes / len(data)) ** 0.9)))
+        data = BlueskyClient._save_jpeg(img, quality)
+        if len(data) <= max_size_bytes:
+            # The guess is usually close, so only look a few steps above it
+            best = data
+            low, high = quality + 1, min(high, quality + 5)
+        else:
+            high = quality - 1
+
+        # Binary search what's left for the highest quality that fits, since output
+        # size grows with quality
+        while low <= high:
+            quality = (low + high) // 2
+            data = BlueskyClient._save_jpeg(img, quality)
+            if len(data) <= max_size_bytes:
+                best = data
+                low = quality + 1
+            else:
+                high = quality - 1
 
-            quality -= 5
+        if best is not None:
+            return best
 
         # If still too large, resize the image
+        quality = 20
         scale = 0.9
         while quality <= 85:
             new_width = int(img.width * scale)
             new_height = int(img.height * scale)
             resized = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
 
-            buffer = io.BytesIO()
-            resized.save(buffer, format="JPEG", quality=quality, optimize=True)
-            size = buffer.tell()
-
-            if size <= max_size_bytes:
-                buffer.seek(0)
-                return buffer.read()
+            data = BlueskyClient._save_jpeg(resized, quality)
+            if len(data) <= max_size_bytes:
+                return data
 
             scale -= 0.1
             if scale < 0.3:
                 quality += 5
 
         # Last resort: return whatever we have
-        buffer.seek(0)
-        return buffer.read()
+        return data
+
+    @staticmethod
+    def _save_jpeg(img: Image.Image, quality: int) -> bytes:
+        """
+        Encode an RGB image as JPEG at the given quality.
+
+        Progressive scans and 4:2:0 chroma subsampling give smaller files at the same
+        visual quality, so more images fit the size limit without lowering quality.
+        A Pillow built against mozjpeg shrinks the output further with no code change.
+        """
+        buffer = io.BytesIO()
+        img.save(
+            buffer,
+            format="JPEG",
+            quality=quality,
+            optimize=True,
+            progressive=True,
+            subsampling=2,
+            exif=b"",
+        )
+        return buffer.getvalue()
+
+    @staticmethod
+    def write_precompressed(image_path: str) -> str:
+        """
+        Compress an image for Bluesky now and save it next to the image.
+
+        compress_image() then reads the saved copy, which moves the encoding work
+        from posting time to whenever the image is stored.
+
+        Args:
+            image_path: Path to the image file
+
+        Returns:
+            Path to the precompressed JPEG
+        """
+        precompressed_path = f"{image_path}{PRECOMPRESSED_SUFFIX}"
+        data = BlueskyClient._encode_jpeg(image_path, MAX_IMAGE_KB)
+        tmp_path = f"{precompressed_path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, precompressed_path)
+        return precompressed_path
 
     def upload_image(self, image_path: str, alt_text: str = "") -> models.AppBskyEmbedImages.Image:
         """
         Upload an image to Bluesky, compressing if necessary.
 
+        An image this client has already uploaded reuses its blob instead.
+
         Args:
             image_path: Path to the image file
             alt_text: Alternative text description for accessibility
@@ -106,9 +310,39 @@ class BlueskyClient:
         Returns:
             Image object that can be used in a post
         """
-        image_data = self.compress_image(image_path)
-        upload_response = self.client.upload_blob(image_data)
-        return models.AppBskyEmbedImages.Image(alt=alt_text, image=upload_response.blob)
+        with open(image_path, "rb") as f:
+            sha256 = hashlib.file_digest(f, "sha256").hexdigest()
+
+        blob = self._blob_cache.get(sha256)
+        if blob is None:
+            image_data = self.compress_image(image_path)
+            blob = self.client.upload_blob(image_data).blob
+            self._blob_cache[sha256] = blob
+
+        return models.AppBskyEmbedImages.Image(alt=alt_text, image=blob)
+
+    def upload_images(
+        self, image_paths: list[str], alt_texts: list[str]
+    ) -> list[models.AppBskyEmbedImages.Image]:
+        """
+        Upload several images to Bluesky at once.
+
+        Each image is compressed and uploaded on its own thread, so a post with
+        several images waits for the slowest upload rather than the sum of them.
+
+        Args:
+            image_paths: Paths to the image files
+            alt_texts: Alt text for each image (extra entries on either side are ignored)
+
+        Returns:
+            Image objects in the same order as image_paths
+        """
+        pairs = list(zip(image_paths, alt_texts, strict=False))
+        if len(pairs) <= 1:
+            return [self.upload_image(img, alt) for img, alt in pairs]
+
+        with ThreadPoolExecutor(max_workers=len(pairs)) as executor:
+            return list(executor.map(lambda pair: self.upload_image(*pair), pairs))
 
     def create_post(
         self, text: str, images: list[str] | None = None, image_alts: list[str] | None = None
@@ -138,9 +372,7 @@ class BlueskyClient:
             if len(image_alts) != len(images):
                 raise ValueError("Number of alt texts must match number of images")
 
-            uploaded_images = [
-                self.upload_image(img, alt) for img, alt in zip(images, image_alts, strict=False)
-            ]
+            uploaded_images = self.upload_images(images, image_alts)
             embed = models.AppBskyEmbedImages.Main(images=uploaded_images)
 
         response = self.client.send_post(text=text, embed=embed)
@@ -155,27 +387,30 @@ class BlueskyClient:
         longitude: float | None,
         unique_sighted: int,
         total_fiskers: int,
-    ) -> tuple[str, str, str | None, str | None]:
+    ) -> tuple[str, str, str | None, str | None, str | None]:
         """
         Build the core parts of a sighting post text.
 
         Returns:
-            Tuple of (ordinal, formatted_time, progress_bar, location_text)
+            Tuple of (ordinal, formatted_time, progress_bar, location_line, neighborhood),
+            where location_line is e.g. "Spotted in Red Hook", or None without GPS, and
+            neighborhood is the geocoded name (None if unknown) for reuse in alt text
         """
         ordinal = self._get_ordinal(sighting_count)
-        dt = datetime.fromisoformat(timestamp)
-        formatted_time = dt.strftime("%B %d, %Y at %I:%M %p")
+        formatted_time = self._format_timestamp(timestamp)
         progress_bar = self._create_progress_bar(unique_sighted, total_fiskers)
 
         # Get location text if GPS coordinates are available
-        location_text = None
+        location_line = None
+        neighborhood = None
         if latitude is not None and longitude is not None:
-            geocoder = Geocoder()
-            location_text = geocoder.get_neighborhood_name(latitude, longitude)
-            if not location_text:
-                location_text = f"{latitude:.4f}, {longitude:.4f}"
+            neighborhood = self.geocoder.get_neighborhood_name(latitude, longitude)
+            if neighborhood:
+                location_line = f"Spotted in {neighborhood}"
+            else:
+                location_line = f"Spotted at {latitude:.4f}, {longitude:.4f}"
 
-        return ordinal, formatted_time, progress_bar, location_text
+        return ordinal, formatted_time, progress_bar, location_line, neighborhood
 
     def format_sighting_text(
         self,
@@ -204,7 +439,7 @@ class BlueskyClient:
         Returns:
             Formatted post text
         """
-        ordinal, formatted_time, progress_bar, location_text = self._build_sighting_text_parts(
+        ordinal, formatted_time, progress_bar, location_line, _ = self._build_sighting_text_parts(
             license_plate,
             sighting_count,
             timestamp,
@@ -215,26 +450,21 @@ class BlueskyClient:
         )
 
         # Build post text
-        post_text = (
+        parts = [
             f"🌊 Fisker Ocean, plate {license_plate} spotted for the {ordinal} time\n"
             f"📈 {progress_bar}\n\n"
             f"📅 {formatted_time}"
-        )
+        ]
 
         # Add location if available
-        if location_text:
-            if latitude is not None and longitude is not None:
-                # Check if it's coordinates or a neighborhood name
-                if "," in location_text and "." in location_text:
-                    post_text += f"\n📍 Spotted at {location_text}"
-                else:
-                    post_text += f"\n📍 Spotted in {location_text}"
+        if location_line:
+            parts.append(f"\n📍 {location_line}")
 
         # Add contributor line if provided
         if contributed_by:
-            post_text += f"\n\n🙏 Contributed by {contributed_by}"
+            parts.append(f"\n\n🙏 Contributed by {contributed_by}")
 
-        return post_text
+        return "".join(parts)
 
     def create_sighting_post(
         self,
@@ -268,8 +498,14 @@ class BlueskyClient:
         # Build post using TextBuilder to support mentions
         text_builder = client_utils.TextBuilder()
 
-        # Get text parts using shared logic
-        ordinal, formatted_time, progress_bar, location_text = self._build_sighting_text_parts(
+        # Get text parts using shared logic; the neighborhood is reused for the alt text
+        (
+            ordinal,
+            formatted_time,
+            progress_bar,
+            location_line,
+            neighborhood,
+        ) = self._build_sighting_text_parts(
             license_plate,
             sighting_count,
             timestamp,
@@ -279,20 +515,15 @@ class BlueskyClient:
             total_fiskers,
         )
 
-        # Add main post content
-        text_builder.text(
+        # Add main post content, with the location if available, as one text segment
+        parts = [
             f"🌊 Fisker Ocean, plate {license_plate} spotted for the {ordinal} time\n"
             f"📈 {progress_bar}\n\n"
             f"📅 {formatted_time}"
-        )
-
-        # Add location if available
-        if location_text:
-            # Check if it's coordinates or a neighborhood name
-            if "," in location_text and "." in location_text:
-                text_builder.text(f"\n📍 Spotted at {location_text}")
-            else:
-                text_builder.text(f"\n📍 Spotted in {location_text}")
+        ]
+        if location_line:
+            parts.append(f"\n📍 {location_line}")
+        text_builder.text("".join(parts))
 
         # Add contributor with mention support
         if contributed_by:
@@ -300,16 +531,15 @@ class BlueskyClient:
                 # Extract handle (remove @ prefix)
                 handle = contributed_by[1:]
 
-                try:
-                    # Resolve handle to DID
-                    profile = self.client.get_profile(handle)
-
+                # Resolve handle to DID
+                did = self._resolve_handles([handle]).get(handle.lower())
+                if did:
                     # Add mention
                     text_builder.text("\n\n🙏 Contributed by ")
-                    text_builder.mention(contributed_by, profile.did)
-                except Exception as e:
+                    text_builder.mention(contributed_by, did)
+                else:
                     # If resolution fails, fall back to plain text
-                    print(f"Warning: Could not resolve handle {handle}, using plain text: {e}")
+                    print(f"Warning: Could not resolve handle {handle}, using plain text")
                     text_builder.text(f"\n\n🙏 Contributed by {contributed_by}")
             else:
                 # Plain text contributor
@@ -317,17 +547,12 @@ class BlueskyClient:
 
         # Generate alt text for images
         image_alts = []
-
-        # Alt text for sighting image
+        location_for_alt = None
         if latitude is not None and longitude is not None:
-            geocoder = Geocoder()
-            location_text = geocoder.get_neighborhood_name(latitude, longitude)
-
-            if location_text:
-                location_for_alt = location_text
-            else:
-                location_for_alt = f"coordinates {latitude:.4f}, {longitude:.4f}"
+            location_for_alt = neighborhood or f"coordinates {latitude:.4f}, {longitude:.4f}"
 
+        # Alt text for sighting image
+        if location_for_alt:
             image_alts.append(
                 f"Spotted a Fisker Ocean with plate {license_plate} in {location_for_alt}"
             )
@@ -336,15 +561,7 @@ class BlueskyClient:
 
         # Alt text for map image (if present)
         if len(images) > 1:
-            if latitude is not None and longitude is not None:
-                geocoder = Geocoder()
-                location_text = geocoder.get_neighborhood_name(latitude, longitude)
-
-                if location_text:
-                    location_for_alt = location_text
-                else:
-                    location_for_alt = f"coordinates {latitude:.4f}, {longitude:.4f}"
-
+            if location_for_alt:
                 image_alts.append(
                     f"Map of the location the Fisker Ocean was spotted in {location_for_alt}"
                 )
@@ -357,9 +574,7 @@ class BlueskyClient:
             if len(images) > 4:
                 raise ValueError("Bluesky supports a maximum of 4 images per post")
 
-            uploaded_images = [
-                self.upload_image(img, alt) for img, alt in zip(images, image_alts, strict=False)
-            ]
+            uploaded_images = self.upload_images(images, image_alts)
             embed = models.AppBskyEmbedImages.Main(images=uploaded_images)
 
         # Send post with TextBuilder
@@ -367,14 +582,65 @@ class BlueskyClient:
         return response
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _format_timestamp(timestamp: str) -> str:
+        """
+        Format an ISO timestamp for a post, e.g. "March 05, 2025 at 02:30 PM".
+
+        Builds the same text as strftime("%B %d, %Y at %I:%M %p") directly.
+        """
+        dt = datetime.fromisoformat(timestamp)
+        hour = dt.hour % 12 or 12
+        meridiem = "AM" if dt.hour < 12 else "PM"
+        return (
+            f"{_MONTH_NAMES[dt.month - 1]} {dt.day:02d}, {dt.year} "
+            f"at {hour:02d}:{dt.minute:02d} {meridiem}"
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def _get_ordinal(n: int) -> str:
         """Convert number to ordinal string (1st, 2nd, 3rd, etc.)"""
-        if 11 <= (n % 100) <= 13:
-            suffix = "th"
-        else:
-            suffix = ["th", "st", "nd", "rd", "th"][min(n % 10, 4)]
+        suffix = "th" if 11 <= (n % 100) <= 13 else _ORDINAL_SUFFIXES[n % 10]
         return f"{n}{suffix}"
 
+    def _resolve_handles(self, handles: list[str]) -> dict[str, str]:
+        """
+        Resolve Bluesky handles to DIDs with a single getProfiles request.
+
+        Handles this client has already resolved are answered from its cache.
+
+        Args:
+            handles: Handles without the @ prefix (at most 25)
+
+        Returns:
+            Dict mapping lowercased handle to DID. Handles that can't be resolved
+            are left out.
+        """
+        dids = {}
+        missing = []
+        for handle in dict.fromkeys(handles):
+            did = self._did_cache.get(handle.lower())
+            if did:
+                dids[handle.lower()] = did
+            else:
+                missing.append(handle)
+
+        if not missing:
+            return dids
+
+        try:
+            response = self.client.get_profiles(missing)
+        except Exception as e:
+            print(f"Warning: Could not resolve handles {', '.join(missing)}: {e}")
+            return dids
+
+        for profile in response.profiles:
+            self._did_cache[profile.handle.lower()] = profile.did
+            dids[profile.handle.lower()] = profile.did
+
+        return dids
+
     def create_batch_sighting_post(
         self, sightings: list[tuple], unique_sighted: int, total_fiskers: int
     ) -> dict:
@@ -384,7 +650,8 @@ class BlueskyClient:
         Args:
             sightings: List of sighting tuples from get_unposted_sightings()
                 (id, license_plate, timestamp, lat, lon, image_path, created_at, post_uri,
-                 contributor_id, preferred_name, bluesky_handle, phone_number)
+                 contributor_id, preferred_name, bluesky_handle, phone_number,
+                 image_basename)
             unique_sighted: Number of unique Fisker plates sighted
             total_fiskers: Total number of Fisker vehicles in TLC database
 
@@ -399,26 +666,28 @@ class BlueskyClient:
 
         # Extract unique contributors with display names
         # Sighting tuple: (id, license_plate, timestamp, lat, lon, image_path, created_at, post_uri,
-        #                  contributor_id, preferred_name, bluesky_handle, phone_number)
-        contributor_display_names = set()
-        unique_contributor_ids = set()
+        #                  contributor_id, preferred_name, bluesky_handle, phone_number,
+        #                  image_basename)
+        # At most four sightings, so a list membership check is cheaper than a set
+        # and keeps names in sighting order
+        contributor_display_names: list[str] = []
+        unique_contributor_ids: list[int] = []
         for sighting in sightings:
             contributor_id = sighting[8]  # contributor_id
             preferred_name = sighting[9]  # preferred_name
             bluesky_handle = sighting[10]  # bluesky_handle
 
-            if contributor_id is not None:
-                unique_contributor_ids.add(contributor_id)
+            if contributor_id is not None and contributor_id not in unique_contributor_ids:
+                unique_contributor_ids.append(contributor_id)
 
                 # Skip adding display name for contributor id = 1
                 if contributor_id == 1:
                     continue
 
-                if preferred_name:
-                    contributor_display_names.add(preferred_name)
-                elif bluesky_handle:
-                    contributor_display_names.add(bluesky_handle)
-            # If neither, they remain anonymous (not added to set)
+                display_name = preferred_name or bluesky_handle
+                if display_name and display_name not in contributor_display_names:
+                    contributor_display_names.append(display_name)
+            # If neither, they remain anonymous (not added to the list)
 
         # Extract license plates
         plates = [sighting[1] for sighting in sightings]  # license_plate column
@@ -430,49 +699,61 @@ class BlueskyClient:
         sighting_word = "sighting" if len(sightings) == 1 else "sightings"
 
         # Count contributors (excluding id = 1)
-        num_contributors_to_show = len(unique_contributor_ids - {1})
+        num_contributors_to_show = sum(1 for cid in unique_contributor_ids if cid != 1)
 
-        text_builder.text(f"🌊 {len(sightings)} new {sighting_word}")
+        # Plain text is collected here and added to the builder in one piece, right
+        # before each mention and at the end
+        parts = [f"🌊 {len(sightings)} new {sighting_word}"]
 
         if num_contributors_to_show > 0:
             contributor_word = "contributor" if num_contributors_to_show == 1 else "contributors"
-            text_builder.text(f" from {num_contributors_to_show} {contributor_word}\n")
+            parts.append(f" from {num_contributors_to_show} {contributor_word}\n")
         else:
-            text_builder.text("\n")
+            parts.append("\n")
 
         # Progress bar
         progress_bar = self._create_progress_bar(unique_sighted, total_fiskers)
-        text_builder.text(f"📈 {progress_bar}\n\n")
+        parts.append(f"📈 {progress_bar}\n\n")
 
         # License plates
         plates_text = ", ".join(plates)
-        text_builder.text(f"🚗 {plates_text}")
+        parts.append(f"🚗 {plates_text}")
 
         # Add contributors with mentions
         if contributor_display_names:
-            text_builder.text("\n\n🙏 Thanks to: ")
+            parts.append("\n\n🙏 Thanks to: ")
+
+            contributor_list = contributor_display_names
+
+            # Resolve every mentioned handle with one request instead of one per contributor
+            dids = self._resolve_handles(
+                [name[1:] for name in contributor_list if name.startswith("@")]
+            )
 
-            contributor_list = sorted(list(contributor_display_names))
             for i, display_name in enumerate(contributor_list):
                 if display_name.startswith("@"):
                     # Extract handle (remove @ prefix)
                     handle = display_name[1:]
 
-                    try:
-                        # Resolve handle to DID
-                        profile = self.client.get_profile(handle)
-                        text_builder.mention(display_name, profile.did)
-                    except Exception as e:
+                    did = dids.get(handle.lower())
+                    if did:
+                        text_builder.text("".join(parts))
+                        parts.clear()
+                        text_builder.mention(display_name, did)
+                    else:
                         # If resolution fails, fall back to plain text
-                        print(f"Warning: Could not resolve handle {handle}, using plain text: {e}")
-                        text_builder.text(display_name)
+                        print(f"Warning: Could not resolve handle {handle}, using plain text")
+                        parts.append(display_name)
                 else:
                     # Plain text contributor name
-                    text_builder.text(display_name)
+                    parts.append(display_name)
 
                 # Add comma separator if not last
                 if i < len(contributor_list) - 1:
-                    text_builder.text(", ")
+                    parts.append(", ")
+
+        if parts:
+            text_builder.text("".join(parts))
 
         # Collect images (max 4)
         images = []
@@ -487,9 +768,7 @@ class BlueskyClient:
         # Upload images
         embed = None
         if images:
-            uploaded_images = [
-                self.upload_image(img, alt) for img, alt in zip(images, image_alts, strict=False)
-            ]
+            uploaded_images = self.upload_images(images, image_alts)
             embed = models.AppBskyEmbedImages.Main(images=uploaded_images)
 
         # Send post
@@ -497,16 +776,10 @@ class BlueskyClient:
         return response
 
     @staticmethod
-    def _get_ordinal(n: int) -> str:
-        """Convert number to ordinal string (1st, 2nd, 3rd, etc.)"""
-        if 11 <= (n % 100) <= 13:
-            suffix = "th"
-        else:
-            suffix = ["th", "st", "nd", "rd", "th"][min(n % 10, 4)]
-        return f"{n}{suffix}"
-
-    @staticmethod
-    def _create_progress_bar(current: int, total: int, bar_length: int = 10) -> str:
+    @functools.lru_cache(maxsize=256)
+    def _create_progress_bar(
+        current: int, total: int, bar_length: int = PROGRESS_BAR_LENGTH
+    ) -> str:
         """
         Create a progress bar with percentage.
 
@@ -520,11 +793,11 @@ class BlueskyClient:
         """
         percentage = (current / total * 100) if total > 0 else 0
         filled = int(bar_length * current / total) if total > 0 else 0
-        empty = bar_length - filled
 
         # Use filled and empty block characters
-        filled_bar = "█" * filled
-        empty_bar = "▒" * empty
-        bar = filled_bar + empty_bar
+        if bar_length == PROGRESS_BAR_LENGTH and 0 <= filled <= bar_length:
+            bar = _PROGRESS_BARS[filled]
+        else:
+            bar = "█" * filled + "▒" * (bar_length - filled)
 
         return f"{percentage:.1f}% {bar} ({current} out of {total})"
@@ -11,6 +11,7 @@ Usage:
 
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import click
@@ -27,6 +28,26 @@ load_dotenv(project_root / ".env")
 from database import SightingsDatabase
 from utils.image_hashing import ImageHashError, calculate_both_hashes
 
+# Sightings read from the database at a time
+PAGE_SIZE = 1000
+
+
+def _hash_image(image_path: str) -> tuple[tuple[str, str] | None, str | None]:
+    """
+    Hash one image in a worker process.
+
+    Errors are returned rather than raised, so one bad image doesn't stop the pool.
+
+    Returns:
+        ((sha256, phash), None) on success, or (None, error message) on failure
+    """
+    try:
+        return calculate_both_hashes(image_path), None
+    except ImageHashError as e:
+        return None, f"Failed to calculate hashes: {e}"
+    except Exception as e:
+        return None, f"Unexpected error: {e}"
+
 
 @click.command()
 @click.option(
@@ -48,18 +69,15 @@ def backfill_hashes(batch_size: int, dry_run: bool):
     conn = db._get_connection()
     cursor = conn.cursor()
 
-    # Get all sightings without hashes
+    # Count sightings without hashes; the rows themselves are read a page at a time
     cursor.execute(
         """
-        SELECT id, image_path
+        SELECT COUNT(*)
         FROM sightings
         WHERE image_hash_sha256 IS NULL OR image_hash_perceptual IS NULL
-        ORDER BY id ASC
         """
     )
-
-    sightings = cursor.fetchall()
-    total = len(sightings)
+    total = cursor.fetchone()[0]
 
     if total == 0:
         click.echo("✓ All sightings already have hashes!")
@@ -72,22 +90,81 @@ def backfill_hashes(batch_size: int, dry_run: bool):
     successful = 0
     skipped = 0
     failed = []
-
-    with click.progressbar(sightings, label="Processing sightings", show_pos=True) as bar:
-        for sighting_id, image_path in bar:
-            processed += 1
-
-            # Check if file exists
-            if not os.path.exists(image_path):
+    # (sha256, phash, sighting_id) rows waiting to be written
+    pending = []
+
+    # Every batch runs the same statement, so parse and plan it once. Taking the
+    # batch as arrays keeps the statement text fixed whatever the batch size.
+    if not dry_run:
+        cursor.execute(
+            """
+            PREPARE set_hashes(text[], text[], int[]) AS
+            UPDATE sightings
+            SET image_hash_sha256 = v.sha256, image_hash_perceptual = v.phash
+            FROM unnest($1, $2, $3) AS v(sha256, phash, id)
+            WHERE sightings.id = v.id
+            """
+        )
+
+    def flush():
+        """Write the pending hashes in one UPDATE and commit them."""
+        # The backfill can always be re-run, so don't wait on the WAL flush
+        cursor.execute("SET LOCAL synchronous_commit = off")
+        sha256s, phashes, ids = (list(column) for column in zip(*pending, strict=True))
+        cursor.execute("EXECUTE set_hashes(%s, %s, %s)", (sha256s, phashes, ids))
+        conn.commit()
+        pending.clear()
+
+    def unhashed_pages():
+        """Yield sightings without hashes in pages, walking forward by id."""
+        last_id = 0
+        while True:
+            cursor.execute(
+                """
+                SELECT id, image_path
+                FROM sightings
+                WHERE (image_hash_sha256 IS NULL OR image_hash_perceptual IS NULL) AND id > %s
+                ORDER BY id ASC
+                LIMIT %s
+                """,
+                (last_id, PAGE_SIZE),
+            )
+            page = cursor.fetchall()
+            if not page:
+                return
+            yield page
+            last_id = page[-1][0]
+
+    # Hashing decodes every image, so spread it across all cores
+    with (
+        ProcessPoolExecutor(max_workers=os.cpu_count()) as executor,
+        click.progressbar(length=total, label="Processing sightings", show_pos=True) as bar,
+    ):
+        for page in unhashed_pages():
+            # Missing files are skipped up front so only real images go to the workers
+            to_hash = []
+            for sighting_id, image_path in page:
+                if os.path.exists(image_path):
+                    to_hash.append((sighting_id, image_path))
+                    continue
+
+                processed += 1
+                bar.update(1)
                 click.echo(f"\n⚠️  Sighting #{sighting_id}: Image file not found: {image_path}")
                 skipped += 1
                 failed.append((sighting_id, image_path, "File not found"))
-                continue
 
-            try:
-                # Calculate hashes
-                sha256, phash = calculate_both_hashes(image_path)
+            results = executor.map(_hash_image, [path for _, path in to_hash], chunksize=16)
+            for (sighting_id, image_path), (hashes, error) in zip(to_hash, results, strict=True):
+                processed += 1
+                bar.update(1)
+
+                if error:
+                    click.echo(f"\n❌ Sighting #{sighting_id}: {error}")
+                    failed.append((sighting_id, image_path, error))
+                    continue
 
+                sha256, phash = hashes
                 if dry_run:
                     click.echo(
                         f"\n[DRY RUN] Would update sighting #{sighting_id}: "
@@ -95,36 +172,17 @@ def backfill_hashes(batch_size: int, dry_run: bool):
                     )
                     successful += 1
                 else:
-                    # Update database
-                    cursor.execute(
-                        """
-                        UPDATE sightings
-                        SET image_hash_sha256 = %s, image_hash_perceptual = %s
-                        WHERE id = %s
-                        """,
-                        (sha256, phash, sighting_id),
-                    )
-
+                    pending.append((sha256, phash, sighting_id))
                     successful += 1
 
-                    # Commit in batches
-                    if successful % batch_size == 0:
-                        conn.commit()
+                    # Write and commit in batches
+                    if len(pending) >= batch_size:
+                        flush()
                         click.echo(f"\n✓ Committed batch of {batch_size} updates")
 
-            except ImageHashError as e:
-                click.echo(f"\n❌ Sighting #{sighting_id}: Failed to calculate hashes: {e}")
-                failed.append((sighting_id, image_path, str(e)))
-                continue
-
-            except Exception as e:
-                click.echo(f"\n❌ Sighting #{sighting_id}: Unexpected error: {e}")
-                failed.append((sighting_id, image_path, str(e)))
-                continue
-
     # Final commit
-    if not dry_run and successful > 0:
-        conn.commit()
+    if pending:
+        flush()
         click.echo("\n✓ Final commit completed")
 
     conn.close()
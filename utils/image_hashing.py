@@ -5,8 +5,10 @@ for detecting exact and near-duplicate images.
 """
 
 import hashlib
+import io
+import re
 
-import imagehash
+import numpy as np
 from PIL import Image
 
 
@@ -33,17 +35,14 @@ def calculate_sha256(image_path: str) -> str:
         ImageHashError: If file cannot be read
     """
     try:
-        sha256_hash = hashlib.sha256()
         with open(image_path, "rb") as f:
-            # Read file in chunks to handle large images efficiently
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
-        return sha256_hash.hexdigest()
+            # Streams the file through OpenSSL in large reads, looping in C
+            return hashlib.file_digest(f, "sha256").hexdigest()
     except OSError as e:
         raise ImageHashError(f"Failed to read image file {image_path}: {e}")
 
 
-def calculate_perceptual_hash(image_path: str) -> str:
+def calculate_perceptual_hash(image: str | Image.Image) -> str:
     """
     Calculate perceptual hash (dHash) of image.
 
@@ -52,7 +51,8 @@ def calculate_perceptual_hash(image_path: str) -> str:
     Uses dHash (difference hash) algorithm for speed and robustness.
 
     Args:
-        image_path: Path to image file
+        image: Path to image file, or an already opened image (avoids decoding
+            the file a second time when the caller has it open)
 
     Returns:
         16-character hex string representing 64-bit perceptual hash
@@ -60,16 +60,49 @@ def calculate_perceptual_hash(image_path: str) -> str:
     Raises:
         ImageHashError: If image cannot be opened or processed
     """
+    if isinstance(image, Image.Image):
+        try:
+            return _dhash(image, draft=False)
+        except Exception as e:
+            raise ImageHashError(f"Failed to calculate perceptual hash: {e}")
+
     try:
-        with Image.open(image_path) as img:
-            # Use dHash (difference hash) - good balance of speed and accuracy
-            # Hash size of 8 gives us 64 bits = 16 hex characters
-            phash = imagehash.dhash(img, hash_size=8)
-            return str(phash)
+        with Image.open(image) as img:
+            return _dhash(img)
     except OSError as e:
-        raise ImageHashError(f"Failed to open image file {image_path}: {e}")
+        raise ImageHashError(f"Failed to open image file {image}: {e}")
     except Exception as e:
-        raise ImageHashError(f"Failed to calculate perceptual hash for {image_path}: {e}")
+        raise ImageHashError(f"Failed to calculate perceptual hash for {image}: {e}")
+
+
+def _dhash(img: Image.Image, draft: bool = True) -> str:
+    """
+    Calculate the dHash of an opened image.
+
+    Args:
+        img: Opened image
+        draft: Let JPEGs decode at reduced size. Only for images opened here,
+            since it changes how the image loads for anyone else holding it.
+
+    Returns:
+        16-character hex string
+    """
+    if draft:
+        # dHash only looks at a 9x8 grayscale thumbnail, so let JPEGs decode
+        # straight to a downscaled grayscale image instead of full resolution
+        img.draft("L", (64, 64))
+
+    # Use dHash (difference hash) - good balance of speed and accuracy
+    # Hash size of 8 gives us 64 bits = 16 hex characters. These are the steps of
+    # imagehash.dhash(img, hash_size=8), LANCZOS resize included, so hashes stay
+    # comparable with the ones already stored, without building its ImageHash
+    # object and formatting it through a string of bits.
+    small = img.convert("L").resize((9, 8), Image.Resampling.LANCZOS)
+    pixels = np.frombuffer(small.tobytes(), dtype=np.uint8).reshape(8, 9)
+
+    # One bit per pixel brighter than its left neighbour, first row first and
+    # most significant bit first, as imagehash renders them in hex
+    return np.packbits(pixels[:, 1:] > pixels[:, :-1]).tobytes().hex()
 
 
 def hamming_distance(hash1: str, hash2: str) -> int:
@@ -93,10 +126,8 @@ def hamming_distance(hash1: str, hash2: str) -> int:
         raise ValueError(f"Hash lengths must match: {len(hash1)} != {len(hash2)}")
 
     try:
-        # Convert hex to binary and count differing bits
-        bits1 = bin(int(hash1, 16))[2:].zfill(len(hash1) * 4)
-        bits2 = bin(int(hash2, 16))[2:].zfill(len(hash2) * 4)
-        return sum(b1 != b2 for b1, b2 in zip(bits1, bits2, strict=False))
+        # XOR leaves a 1 wherever the hashes differ; bit_count() is a native popcount
+        return (int(hash1, 16) ^ int(hash2, 16)).bit_count()
     except ValueError as e:
         raise ValueError(f"Invalid hex hash: {e}")
 
@@ -105,7 +136,8 @@ def calculate_both_hashes(image_path: str) -> tuple[str, str]:
     """
     Calculate both SHA-256 and perceptual hashes for an image.
 
-    Convenience function for getting both hashes at once.
+    Opens the file once and streams it through both hashes, so the whole file is
+    never held in memory.
 
     Args:
         image_path: Path to image file
@@ -116,8 +148,45 @@ def calculate_both_hashes(image_path: str) -> tuple[str, str]:
     Raises:
         ImageHashError: If image cannot be processed
     """
-    sha256 = calculate_sha256(image_path)
-    phash = calculate_perceptual_hash(image_path)
+    try:
+        with open(image_path, "rb") as f:
+            sha256 = hashlib.file_digest(f, "sha256").hexdigest()
+            f.seek(0)
+
+            # ImageHashError isn't an OSError, so this isn't reported as a read failure
+            try:
+                with Image.open(f) as img:
+                    phash = _dhash(img)
+            except Exception as e:
+                raise ImageHashError(f"Failed to calculate perceptual hash for {image_path}: {e}")
+    except OSError as e:
+        raise ImageHashError(f"Failed to read image file {image_path}: {e}")
+
+    return sha256, phash
+
+
+def calculate_hashes_from_bytes(data: bytes, image_path: str = "<bytes>") -> tuple[str, str]:
+    """
+    Calculate both SHA-256 and perceptual hashes from an image already in memory.
+
+    Args:
+        data: Raw image file contents
+        image_path: Path the bytes came from (used in error messages)
+
+    Returns:
+        Tuple of (sha256_hash, perceptual_hash)
+
+    Raises:
+        ImageHashError: If image cannot be processed
+    """
+    sha256 = hashlib.sha256(data).hexdigest()
+
+    try:
+        with Image.open(io.BytesIO(data)) as img:
+            phash = _dhash(img)
+    except Exception as e:
+        raise ImageHashError(f"Failed to calculate perceptual hash for {image_path}: {e}")
+
     return sha256, phash
 
 
@@ -146,39 +215,38 @@ def find_similar_images(
         ...     print(f"Found {len(similar)} similar images")
         ...     print(f"Most similar: {similar[0]['image_path']} (distance: {similar[0]['distance']})")
     """
+    # Stored hashes are 64-bit dHashes (16 hex digits); nothing else can match
+    if not re.fullmatch(r"[0-9a-fA-F]{16}", perceptual_hash):
+        return []
+
     cursor = db_connection.cursor()
 
-    # Get all sightings with perceptual hashes
+    # XOR and popcount in the database (migration 006), so only matches come back
     cursor.execute(
         """
-        SELECT id, image_path, created_at, image_hash_perceptual
-        FROM sightings
-        WHERE image_hash_perceptual IS NOT NULL
-        """
+        SELECT id, image_path, created_at, image_hash_perceptual, distance
+        FROM (
+            SELECT id, image_path, created_at, image_hash_perceptual,
+                bit_count(image_hash_perceptual_bits # ('x' || %s)::BIT(64)) AS distance
+            FROM sightings
+            WHERE image_hash_perceptual_bits IS NOT NULL
+        ) AS scored
+        WHERE distance <= %s
+        ORDER BY distance, id
+        """,
+        (perceptual_hash, threshold),
     )
 
-    results = []
-    for row in cursor.fetchall():
-        sighting_id, image_path, created_at, db_hash = row
-        try:
-            distance = hamming_distance(perceptual_hash, db_hash)
-            if distance <= threshold:
-                results.append(
-                    {
-                        "id": sighting_id,
-                        "image_path": image_path,
-                        "created_at": created_at,
-                        "image_hash_perceptual": db_hash,
-                        "distance": distance,
-                    }
-                )
-        except ValueError:
-            # Skip invalid hashes
-            continue
-
-    # Sort by distance (most similar first)
-    results.sort(key=lambda x: x["distance"])
-    return results
+    return [
+        {
+            "id": sighting_id,
+            "image_path": image_path,
+            "created_at": created_at,
+            "image_hash_perceptual": db_hash,
+            "distance": distance,
+        }
+        for sighting_id, image_path, created_at, db_hash, distance in cursor.fetchall()
+    ]
 
 
 def check_exact_duplicate(db_connection, sha256_hash: str) -> dict | None:
@@ -40,10 +40,10 @@ def get_potential_matches(
         List of matching license plate strings
     """
     tlc_db = TLCDatabase(db_url)
-    results = tlc_db.search_plates_wildcard(partial_plate)
+    results = tlc_db.search_plates_wildcard(partial_plate, limit=max_results)
 
     # Extract just the plate numbers
-    plates = [row[0] for row in results[:max_results]]
+    plates = [row[0] for row in results]
     return plates
 
 
@@ -62,24 +62,21 @@ def find_similar_plates(plate: str, db_url: str = None, max_results: int = 5) ->
     Returns:
         List of similar license plate strings, sorted by similarity
     """
+    import numpy as np
+
     tlc_db = TLCDatabase(db_url)
     all_plates = tlc_db.get_all_plates()
 
-    # Calculate similarity scores
-    scored_plates = []
-    for candidate in all_plates:
-        if len(candidate) != len(plate):
-            continue
-
-        # Count differing characters
-        diff_count = sum(
-            1 for a, b in zip(plate.upper(), candidate.upper(), strict=False) if a != b
-        )
+    plate = plate.upper()
+    candidates = [candidate for candidate in all_plates if len(candidate) == len(plate)]
+    if not plate or not candidates:
+        return []
 
-        # Only include plates with 1-2 character differences
-        if 0 < diff_count <= 2:
-            scored_plates.append((diff_count, candidate))
+    # One row of characters per candidate, compared against the plate all at once
+    chars = np.array([candidate.upper() for candidate in candidates]).view("U1")
+    diff_counts = np.count_nonzero(chars.reshape(len(candidates), -1) != list(plate), axis=1)
 
-    # Sort by difference count and return top matches
-    scored_plates.sort(key=lambda x: x[0])
-    return [p[1] for p in scored_plates[:max_results]]
+    # Only include plates with 1-2 character differences, fewest differences first
+    matches = np.flatnonzero((diff_counts > 0) & (diff_counts <= 2))
+    matches = matches[np.argsort(diff_counts[matches], kind="stable")]
+    return [candidates[i] for i in matches[:max_results]]
@@ -1,13 +1,79 @@
 """TLC (Taxi & Limousine Commission) database operations."""
 
 import csv
+import io
 import os
+import time
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 
-import psycopg2
 import requests
 
+from database.connection import get_connection, release_connection
+
+# Columns an import writes, in TLC CSV order
+TLC_COLUMNS = """
+    active, vehicle_license_number, name, license_type,
+    expiration_date, permit_license_number, dmv_license_plate_number,
+    vehicle_vin_number, wheelchair_accessible, certification_date,
+    hack_up_date, vehicle_year, base_number, base_name,
+    base_type, veh, base_telephone_number, website,
+    base_address, reason, order_date, last_date_updated,
+    last_time_updated, import_date
+"""
+
+# TLC CSV headers for each of TLC_COLUMNS except import_date, in the same order
+TLC_CSV_HEADERS = (
+    "Active", "Vehicle License Number", "Name", "License Type",
+    "Expiration Date", "Permit License Number", "DMV License Plate Number",
+    "Vehicle VIN Number", "Wheelchair Accessible", "Certification Date",
+    "Hack Up Date", "Vehicle Year", "Base Number", "Base Name",
+    "Base Type", "VEH", "Base Telephone Number", "Website",
+    "Base Address", "Reason", "Order Date", "Last Date Updated",
+    "Last Time Updated",
+)  # fmt: skip
+
+# How long get_all_plates() results are reused. Imports drop the cache early.
+PLATES_CACHE_SECONDS = 300
+
+# db_url -> (plates, expires_at). Module-level so a warm container keeps it across
+# TLCDatabase instances, which matcher functions create per call.
+_plates_cache: dict[str, tuple[list[str], float]] = {}
+
+
+def plate_pattern_condition(pattern: str) -> tuple[str, str]:
+    """
+    Build a WHERE condition for a license plate pattern where * matches one character.
+
+    Patterns without wildcards become an equality check. Otherwise the LIKE runs
+    against the plate or its reverse, whichever starts with the longer fixed run,
+    so the text_pattern_ops indexes (database/migrations) can use a range scan.
+    Patterns wildcarded at both ends fall back to the trigram index. Literal %
+    and _ in the pattern are escaped and only match themselves.
+
+    Args:
+        pattern: Search pattern like 'T73**580C'
+
+    Returns:
+        Tuple of (SQL condition with one %s placeholder, parameter)
+    """
+    if "*" not in pattern:
+        return "dmv_license_plate_number = %s", pattern
+
+    fixed_prefix = pattern.index("*")
+    fixed_suffix = len(pattern) - 1 - pattern.rindex("*")
+
+    column = "dmv_license_plate_number"
+    if fixed_suffix > fixed_prefix:
+        column = f"reverse({column})"
+        pattern = pattern[::-1]
+
+    # Escape LIKE metacharacters so a typed % or _ can't widen the match (or drop
+    # the fixed prefix the index range scan depends on)
+    escaped = pattern.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"{column} LIKE %s", escaped.replace("*", "_")
+
 
 class TLCDatabase:
     """Database operations for NYC TLC vehicle registry."""
@@ -21,19 +87,28 @@ class TLCDatabase:
             raise ValueError("DATABASE_URL not provided and not found in environment")
 
     def _get_connection(self):
-        """Get a database connection."""
-        return psycopg2.connect(self.db_url)
+        """Get a database connection from the process-wide pool."""
+        return get_connection(self.db_url)
+
+    def _release(self, conn):
+        """Return a connection from _get_connection() to the pool."""
+        release_connection(self.db_url, conn)
 
-    def download_tlc_csv(self, output_dir: str = "/data/tlc") -> str:
+    def download_tlc_csv(
+        self, output_dir: str = "/data/tlc", etag: str | None = None
+    ) -> tuple[str | None, str | None]:
         """
         Download the latest TLC vehicle CSV from NYC Open Data.
         Stores versioned copies and maintains a _latest symlink.
 
         Args:
             output_dir: Directory to store CSV files (default: /data/tlc for Modal volume)
+            etag: ETag of the last downloaded CSV. If the data hasn't changed since,
+                nothing is downloaded.
 
         Returns:
-            Path to the downloaded CSV file
+            (path to the downloaded CSV file, its ETag). The path is None if the data
+            is unchanged since etag.
 
         Raises:
             requests.RequestException: If download fails
@@ -49,7 +124,11 @@ class TLCDatabase:
 
         # Download CSV
         print(f"Downloading TLC vehicle data from {self.TLC_CSV_URL}...")
-        response = requests.get(self.TLC_CSV_URL, stream=True)
+        headers = {"If-None-Match": etag} if etag else {}
+        response = requests.get(self.TLC_CSV_URL, headers=headers, stream=True)
+        if response.status_code == 304:
+            print("✓ TLC data unchanged since last download")
+            return None, etag
         response.raise_for_status()
 
         # Save versioned file
@@ -74,15 +153,22 @@ class TLCDatabase:
             shutil.copy2(versioned_file, latest_file)
             print(f"✓ Copied to {latest_file}")
 
-        return str(versioned_file)
+        return str(versioned_file), response.headers.get("ETag")
 
-    def import_tlc_data(self, csv_path: str, filter_fisker: bool = True) -> int:
+    def import_tlc_data(
+        self, csv_path: str, filter_fisker: bool = True, batch_size: int = 5000
+    ) -> int:
         """
         Import TLC vehicle data from CSV file.
 
+        Rows are streamed with COPY into a temporary staging table, batch_size rows
+        per COPY, then upserted into tlc_vehicles with one INSERT ... SELECT. It
+        all runs in one transaction committed asynchronously.
+
         Args:
             csv_path: Path to the TLC CSV file
             filter_fisker: If True, only import Fisker vehicles (VIN starts with VCF1)
+            batch_size: Number of rows sent to the database per COPY
 
         Returns:
             Number of records imported
@@ -93,93 +179,113 @@ class TLCDatabase:
         import_date = datetime.now().isoformat()
         count = 0
         skipped = 0
+        buffer = io.StringIO()
+        # Leave None unquoted so COPY reads it as NULL, like the parameterized INSERT did
+        writer = csv.writer(buffer, quoting=csv.QUOTE_NOTNULL)
 
-        with open(csv_path, encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-
-            for row in reader:
-                # Filter Fisker vehicles during import if requested
-                vin = row.get("Vehicle VIN Number", "")
-                if filter_fisker and not vin.startswith("VCF1"):
-                    skipped += 1
-                    continue
-
-                try:
-                    cursor.execute(
-                        """
-                        INSERT INTO tlc_vehicles (
-                            active, vehicle_license_number, name, license_type,
-                            expiration_date, permit_license_number, dmv_license_plate_number,
-                            vehicle_vin_number, wheelchair_accessible, certification_date,
-                            hack_up_date, vehicle_year, base_number, base_name,
-                            base_type, veh, base_telephone_number, website,
-                            base_address, reason, order_date, last_date_updated,
-                            last_time_updated, import_date
-                        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                        ON CONFLICT (dmv_license_plate_number) DO UPDATE SET
-                            active = EXCLUDED.active,
-                            vehicle_license_number = EXCLUDED.vehicle_license_number,
-                            name = EXCLUDED.name,
-                            license_type = EXCLUDED.license_type,
-                            expiration_date = EXCLUDED.expiration_date,
-                            permit_license_number = EXCLUDED.permit_license_number,
-                            vehicle_vin_number = EXCLUDED.vehicle_vin_number,
-                            wheelchair_accessible = EXCLUDED.wheelchair_accessible,
-                            certification_date = EXCLUDED.certification_date,
-                            hack_up_date = EXCLUDED.hack_up_date,
-                            vehicle_year = EXCLUDED.vehicle_year,
-                            base_number = EXCLUDED.base_number,
-                            base_name = EXCLUDED.base_name,
-                            base_type = EXCLUDED.base_type,
-                            veh = EXCLUDED.veh,
-                            base_telephone_number = EXCLUDED.base_telephone_number,
-                            website = EXCLUDED.website,
-                            base_address = EXCLUDED.base_address,
-                            reason = EXCLUDED.reason,
-                            order_date = EXCLUDED.order_date,
-                            last_date_updated = EXCLUDED.last_date_updated,
-                            last_time_updated = EXCLUDED.last_time_updated,
-                            import_date = EXCLUDED.import_date
-                    """,
-                        (
-                            row.get("Active", ""),
-                            row.get("Vehicle License Number", ""),
-                            row.get("Name", ""),
-                            row.get("License Type", ""),
-                            row.get("Expiration Date", ""),
-                            row.get("Permit License Number", ""),
-                            row.get("DMV License Plate Number", ""),
-                            vin,
-                            row.get("Wheelchair Accessible", ""),
-                            row.get("Certification Date", ""),
-                            row.get("Hack Up Date", ""),
-                            row.get("Vehicle Year", ""),
-                            row.get("Base Number", ""),
-                            row.get("Base Name", ""),
-                            row.get("Base Type", ""),
-                            row.get("VEH", ""),
-                            row.get("Base Telephone Number", ""),
-                            row.get("Website", ""),
-                            row.get("Base Address", ""),
-                            row.get("Reason", ""),
-                            row.get("Order Date", ""),
-                            row.get("Last Date Updated", ""),
-                            row.get("Last Time Updated", ""),
-                            import_date,
-                        ),
-                    )
+        try:
+            # The import can always be re-run from the CSV, so don't wait on the WAL flush
+            cursor.execute("SET LOCAL synchronous_commit = off")
+            # Same column types as tlc_vehicles, plus the CSV order so the upsert can
+            # keep the last row for a plate, as row-by-row upserts used to
+            cursor.execute(
+                f"""
+                CREATE TEMP TABLE tlc_import ON COMMIT DROP AS
+                SELECT {TLC_COLUMNS} FROM tlc_vehicles WITH NO DATA;
+                ALTER TABLE tlc_import ADD COLUMN seq BIGSERIAL;
+            """
+            )
+
+            with open(csv_path, encoding="utf-8") as f:
+                # Plain rows picked by position, rather than a dict built per row
+                reader = csv.reader(f)
+                header = next(reader, [])
+                width = len(header)
+
+                # Columns missing from the header point one past the end, at a ""
+                # appended to each row. Short rows are padded with None (NULL).
+                index = {name: i for i, name in enumerate(header)}
+                pick = itemgetter(*(index.get(name, width) for name in TLC_CSV_HEADERS))
+                vin_index = index.get("Vehicle VIN Number", width)
+                padding = [None] * width + [""]
+
+                for row in reader:
+                    # DictReader skipped blank lines; keep doing so
+                    if not row:
+                        continue
+                    row.extend(padding[len(row) :])
+
+                    # Filter Fisker vehicles during import if requested
+                    if filter_fisker and not row[vin_index].startswith("VCF1"):
+                        skipped += 1
+                        continue
+
+                    writer.writerow((*pick(row), import_date))
                     count += 1
-                except psycopg2.IntegrityError:
-                    pass
 
-        conn.commit()
-        conn.close()
+                    if count % batch_size == 0:
+                        self._copy_to_staging(cursor, buffer)
+
+            self._copy_to_staging(cursor, buffer)
+            self._upsert_from_staging(cursor)
+
+            conn.commit()
+        finally:
+            self._release(conn)
+        _plates_cache.pop(self.db_url, None)
 
         if filter_fisker:
             print(f"  Skipped {skipped:,} non-Fisker vehicles")
 
         return count
 
+    @staticmethod
+    def _copy_to_staging(cursor, buffer: io.StringIO):
+        """COPY the CSV rows in buffer into tlc_import, then empty the buffer."""
+        if not buffer.tell():
+            return
+
+        buffer.seek(0)
+        cursor.copy_expert(f"COPY tlc_import ({TLC_COLUMNS}) FROM STDIN WITH (FORMAT csv)", buffer)
+        buffer.seek(0)
+        buffer.truncate()
+
+    @staticmethod
+    def _upsert_from_staging(cursor):
+        """Insert or update tlc_vehicles from tlc_import, keeping the last row per plate."""
+        cursor.execute(
+            f"""
+            INSERT INTO tlc_vehicles ({TLC_COLUMNS})
+            SELECT DISTINCT ON (dmv_license_plate_number) {TLC_COLUMNS}
+            FROM tlc_import
+            ORDER BY dmv_license_plate_number, seq DESC
+            ON CONFLICT (dmv_license_plate_number) DO UPDATE SET
+                active = EXCLUDED.active,
+                vehicle_license_number = EXCLUDED.vehicle_license_number,
+                name = EXCLUDED.name,
+                license_type = EXCLUDED.license_type,
+                expiration_date = EXCLUDED.expiration_date,
+                permit_license_number = EXCLUDED.permit_license_number,
+                vehicle_vin_number = EXCLUDED.vehicle_vin_number,
+                wheelchair_accessible = EXCLUDED.wheelchair_accessible,
+                certification_date = EXCLUDED.certification_date,
+                hack_up_date = EXCLUDED.hack_up_date,
+                vehicle_year = EXCLUDED.vehicle_year,
+                base_number = EXCLUDED.base_number,
+                base_name = EXCLUDED.base_name,
+                base_type = EXCLUDED.base_type,
+                veh = EXCLUDED.veh,
+                base_telephone_number = EXCLUDED.base_telephone_number,
+                website = EXCLUDED.website,
+                base_address = EXCLUDED.base_address,
+                reason = EXCLUDED.reason,
+                order_date = EXCLUDED.order_date,
+                last_date_updated = EXCLUDED.last_date_updated,
+                last_time_updated = EXCLUDED.last_time_updated,
+                import_date = EXCLUDED.import_date
+        """
+        )
+
     def filter_fisker_vehicles(self) -> int:
         """
         Remove all non-Fisker vehicles from the TLC database.
@@ -193,10 +299,11 @@ class TLCDatabase:
 
         cursor.execute("DELETE FROM tlc_vehicles WHERE vehicle_vin_number NOT LIKE 'VCF1%'")
         conn.commit()
+        _plates_cache.pop(self.db_url, None)
 
         cursor.execute("SELECT COUNT(*) FROM tlc_vehicles")
         count = cursor.fetchone()[0]
-        conn.close()
+        self._release(conn)
 
         return count
 
@@ -213,7 +320,7 @@ class TLCDatabase:
         )
 
         vehicle = cursor.fetchone()
-        conn.close()
+        self._release(conn)
 
         return vehicle
 
@@ -224,17 +331,18 @@ class TLCDatabase:
 
         cursor.execute("SELECT COUNT(*) FROM tlc_vehicles")
         count = cursor.fetchone()[0]
-        conn.close()
+        self._release(conn)
 
         return count
 
-    def search_plates_wildcard(self, pattern: str) -> list:
+    def search_plates_wildcard(self, pattern: str, limit: int | None = None) -> list:
         """
         Search for license plates using wildcard pattern.
         Use * for any single character.
 
         Args:
             pattern: Search pattern like 'T73**580C' where * matches any character
+            limit: Maximum number of records to return (default: all)
 
         Returns:
             List of matching vehicle records
@@ -242,27 +350,35 @@ class TLCDatabase:
         conn = self._get_connection()
         cursor = conn.cursor()
 
-        # Convert * to SQL wildcard _
-        sql_pattern = pattern.replace("*", "_")
+        condition, param = plate_pattern_condition(pattern)
 
         cursor.execute(
-            """
+            f"""
             SELECT dmv_license_plate_number, vehicle_vin_number, vehicle_year,
                    name, base_name, base_type
             FROM tlc_vehicles
-            WHERE dmv_license_plate_number LIKE %s
+            WHERE {condition}
             ORDER BY dmv_license_plate_number
+            LIMIT %s
         """,
-            (sql_pattern,),
+            (param, limit),
         )
 
         results = cursor.fetchall()
-        conn.close()
+        self._release(conn)
 
         return results
 
     def get_all_plates(self) -> list[str]:
-        """Get all license plates in the TLC database."""
+        """
+        Get all license plates in the TLC database.
+
+        The list is cached for PLATES_CACHE_SECONDS, or until the next import.
+        """
+        cached = _plates_cache.get(self.db_url)
+        if cached and cached[1] > time.monotonic():
+            return list(cached[0])
+
         conn = self._get_connection()
         cursor = conn.cursor()
 
@@ -270,9 +386,10 @@ class TLCDatabase:
             "SELECT dmv_license_plate_number FROM tlc_vehicles ORDER BY dmv_license_plate_number"
         )
         plates = [row[0] for row in cursor.fetchall()]
-        conn.close()
+        self._release(conn)
 
-        return plates
+        _plates_cache[self.db_url] = (plates, time.monotonic() + PLATES_CACHE_SECONDS)
+        return list(plates)
 
     def update_from_nyc_open_data(self, output_dir: str = "/data/tlc") -> dict:
         """
@@ -286,19 +403,41 @@ class TLCDatabase:
             dict with statistics: {
                 'csv_path': str,
                 'fisker_count': int,
+                'unchanged': bool,
                 'timestamp': str
             }
         """
-        # Download latest CSV
-        csv_path = self.download_tlc_csv(output_dir)
+        # ETag of the last imported CSV, only trusted while that CSV is still on disk
+        etag_file = Path(output_dir) / "etag.txt"
+        latest_file = Path(output_dir) / "tlc_vehicles_latest.csv"
+        etag = None
+        if etag_file.exists() and latest_file.exists():
+            etag = etag_file.read_text().strip() or None
+
+        # Download latest CSV, unless it hasn't changed
+        csv_path, new_etag = self.download_tlc_csv(output_dir, etag=etag)
+        if csv_path is None:
+            return {
+                "csv_path": str(latest_file),
+                "fisker_count": 0,
+                "unchanged": True,
+                "timestamp": datetime.now().isoformat(),
+            }
 
         # Import only Fisker vehicles (filter during import for efficiency)
         print("\nImporting Fisker Ocean vehicles (VIN starts with VCF1)...")
         fisker_count = self.import_tlc_data(csv_path, filter_fisker=True)
         print(f"✓ Imported/updated {fisker_count:,} Fisker Ocean vehicles")
 
+        # Only remember the ETag once its data is imported, so a failed import is retried
+        if new_etag:
+            etag_file.write_text(new_etag)
+        elif etag_file.exists():
+            etag_file.unlink()
+
         return {
             "csv_path": csv_path,
             "fisker_count": fisker_count,
+            "unchanged": False,
             "timestamp": datetime.now().isoformat(),
         }